@@ -0,0 +1,166 @@
+'''
+	binning.py - v2020.05.12
+
+	Authors: Andreas Tritsarolis, Christos Doulkeridis, Yannis Theodoridis and Nikos Pelekis
+
+	Notes:
+		* The hexagonal grid arithmetic (axial coordinates, cube rounding) follows: Hexagonal Grids, https://www.redblobgames.com/grids/hexagons/
+'''
+
+
+import shapely
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+
+from geom_helper import SHAPELY_VECTORIZED
+
+
+def _get_bbox(gdf, bbox):
+	"""
+	Returns the bounding box (minx, miny, maxx, maxy) that the grid will cover; either the given one or the total bounds of ```gdf```.
+	"""
+	return np.asarray(gdf.total_bounds if bbox is None else bbox, dtype=float)
+
+
+def _aggregate_cells(gdf, cell_ids, aggregates):
+	"""
+	Aggregate the rows of ```gdf``` per (non-negative) cell id. Returns a DataFrame indexed by cell id with the count of each cell and the requested aggregates.
+	"""
+	valid = cell_ids >= 0
+	cell_ids = cell_ids[valid]
+
+	counts = pd.Series(np.bincount(cell_ids), name='count')
+	counts = counts.loc[counts > 0]
+
+	if not aggregates:
+		return counts.to_frame()
+
+	named_aggs = {}
+	for column, funcs in aggregates.items():
+		for func in ([funcs] if isinstance(funcs, str) or callable(funcs) else funcs):
+			func_name = func if isinstance(func, str) else func.__name__
+			named_aggs[f'{column}_{func_name}'] = (column, func)
+
+	return counts.to_frame().join(gdf.loc[valid, list(aggregates.keys())].groupby(cell_ids).agg(**named_aggs))
+
+
+def grid_aggregate(gdf, cell_width, cell_height=None, bbox=None, aggregates=None):
+	"""
+	Bin Point Geometries to a regular rectangular grid and aggregate them per cell. Each point's cell is found arithmetically (no spatial predicates are evaluated).
+
+	Parameters
+	----------
+	gdf: GeoPandas GeoDataFrame
+		Contains information about the Point Geometries
+	cell_width: Numeric
+		The width of each cell (in the units of ```gdf```'s CRS)
+	cell_height: Numeric (default: None)
+		The height of each cell (in the units of ```gdf```'s CRS). If None, it is equal to ```cell_width``` (i.e., square cells).
+	bbox: Tuple (minx, miny, maxx, maxy) (default: None)
+		The area that the grid will cover. If None, the total bounds of ```gdf``` are used. Points outside of it are ignored.
+	aggregates: Dict (default: None)
+		The column reductions to compute per cell, as ```{column: func}``` or ```{column: [func, ...]}``` (consult pandas.DataFrame.agg method), e.g. ```{'speed': ['mean', 'max']}```.
+		Each reduction is stored at column ```f'{column}_{func}'```.
+
+	Returns
+	-------
+	GeoPandas GeoDataFrame
+		The (non-empty) cells of the grid as Polygons (ready for ```st_visualizer.add_polygon```), with their grid indices (```cell_x```, ```cell_y```), the number of points (```count```) and the requested aggregates.
+	"""
+	cell_height = cell_width if cell_height is None else cell_height
+	minx, miny, maxx, maxy = _get_bbox(gdf, bbox)
+
+	n_x = max(int(np.ceil((maxx - minx) / cell_width)), 1)
+	n_y = max(int(np.ceil((maxy - miny) / cell_height)), 1)
+
+	x, y = gdf.geometry.x.values, gdf.geometry.y.values
+	inside = (x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy)
+
+	# Points on the upper/right edge of the bbox belong to the last row/column of cells
+	cell_x = np.minimum(np.floor((x - minx) / cell_width), n_x - 1)
+	cell_y = np.minimum(np.floor((y - miny) / cell_height), n_y - 1)
+	cell_ids = np.where(inside, cell_y * n_x + cell_x, -1).astype(np.int64)
+
+	cells = _aggregate_cells(gdf, cell_ids, aggregates)
+	cells.insert(0, 'cell_x', cells.index.values % n_x)
+	cells.insert(1, 'cell_y', cells.index.values // n_x)
+
+	x0 = minx + cells.cell_x.values * cell_width
+	y0 = miny + cells.cell_y.values * cell_height
+
+	if SHAPELY_VECTORIZED:
+		geoms = shapely.box(x0, y0, x0 + cell_width, y0 + cell_height)
+	else:
+		geoms = [shapely.geometry.box(*b) for b in zip(x0, y0, x0 + cell_width, y0 + cell_height)]
+
+	cells = cells.reset_index(drop=True)
+	cells.loc[:, 'geom'] = geoms
+
+	return gpd.GeoDataFrame(cells, geometry='geom', crs=gdf.crs)
+
+
+def hexbin_aggregate(gdf, size, bbox=None, aggregates=None):
+	"""
+	Bin Point Geometries to a regular (pointy-topped) hexagonal grid and aggregate them per cell. Each point's cell is found arithmetically (no spatial predicates are evaluated).
+
+	Parameters
+	----------
+	gdf: GeoPandas GeoDataFrame
+		Contains information about the Point Geometries
+	size: Numeric
+		The size (i.e., the distance from the center to any vertex) of each hexagon (in the units of ```gdf```'s CRS)
+	bbox: Tuple (minx, miny, maxx, maxy) (default: None)
+		The area that the grid will cover. If None, the total bounds of ```gdf``` are used. Points outside of it are ignored.
+	aggregates: Dict (default: None)
+		The column reductions to compute per cell, as ```{column: func}``` or ```{column: [func, ...]}``` (consult pandas.DataFrame.agg method), e.g. ```{'speed': ['mean', 'max']}```.
+		Each reduction is stored at column ```f'{column}_{func}'```.
+
+	Returns
+	-------
+	GeoPandas GeoDataFrame
+		The (non-empty) cells of the grid as Polygons (ready for ```st_visualizer.add_polygon```), with their axial coordinates (```cell_q```, ```cell_r```), the number of points (```count```) and the requested aggregates.
+	"""
+	minx, miny, maxx, maxy = _get_bbox(gdf, bbox)
+
+	x, y = gdf.geometry.x.values, gdf.geometry.y.values
+	inside = (x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy)
+
+	# Fractional axial coordinates (relative to the bbox's lower-left corner), rounded to the nearest hexagon via cube coordinates
+	q = (np.sqrt(3) / 3 * (x - minx) - (y - miny) / 3) / size
+	r = (2 / 3 * (y - miny)) / size
+	s = -q - r
+
+	rq, rr, rs = np.round(q), np.round(r), np.round(s)
+	dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+
+	fix_q = (dq > dr) & (dq > ds)
+	fix_r = ~fix_q & (dr > ds)
+	rq = np.where(fix_q, -rr - rs, rq)
+	rr = np.where(fix_r, -rq - rs, rr)
+
+	# Shift the axial coordinates to non-negative values, in order to enumerate the hexagons
+	q_min, r_min = np.min(rq[inside], initial=0), np.min(rr[inside], initial=0)
+	n_q = int(np.max(rq[inside], initial=0) - q_min) + 1
+
+	cell_ids = np.where(inside, (rr - r_min) * n_q + (rq - q_min), -1).astype(np.int64)
+
+	cells = _aggregate_cells(gdf, cell_ids, aggregates)
+	cells.insert(0, 'cell_q', (cells.index.values % n_q + q_min).astype(np.int64))
+	cells.insert(1, 'cell_r', (cells.index.values // n_q + r_min).astype(np.int64))
+
+	center_x = minx + size * np.sqrt(3) * (cells.cell_q.values + cells.cell_r.values / 2)
+	center_y = miny + size * 3 / 2 * cells.cell_r.values
+
+	angles = np.deg2rad(30 + 60 * np.arange(6))
+	vertices = np.stack([center_x[:, None] + size * np.cos(angles), center_y[:, None] + size * np.sin(angles)], axis=-1)
+
+	if SHAPELY_VECTORIZED:
+		geoms = shapely.polygons(vertices)
+	else:
+		geoms = [shapely.geometry.Polygon(v) for v in vertices]
+
+	cells = cells.reset_index(drop=True)
+	cells.loc[:, 'geom'] = geoms
+
+	return gpd.GeoDataFrame(cells, geometry='geom', crs=gdf.crs)
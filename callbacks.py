@@ -6,9 +6,131 @@
 
 
 import abc
+import threading
+import numpy as np
 import bokeh.models as bokeh_mdl
 
 
+class FilterRequest:
+    def __init__(self, owner=None, generation=0):
+        '''
+        Constructor for the FilterRequest Class. Holds the state of a single filtering request, in place of state shared among (possibly interleaving) callbacks.
+          * owner: The id of the widget that renders the request's output (i.e., ```st_visualizer.aquire_canvas_data```)
+          * generation: The sequence number of the request; requests superseded by a newer one are dropped
+        '''
+        self.owner = owner
+        self.generation = generation
+        self.canvas_data = None
+        self.active_index = None
+
+
+class FilterEngine:
+    def __init__(self):
+        '''
+        Constructor for the FilterEngine Class. Caches the current boolean mask (over the rows of the loaded dataset) of each filter, 
+        so that a change on a filter recomputes only its own mask, while the rendered rows are given by the conjunction (AND) of all masks.
+        '''
+        self.masks = {}
+        self.callbacks = {}
+        self.dirty = set()
+        self.lock = threading.RLock()
+
+
+    def register(self, widget, callback):
+        '''
+        Register the callback instance (callbacks.BokehFilters) of a widget.
+        '''
+        self.callbacks[widget.id] = callback
+
+
+    def is_mask_based(self, widget):
+        '''
+        Checks whether the callback of a widget computes a mask (i.e., implements ```BokehFilters.compute_mask```).
+        '''
+        callback = self.callbacks.get(widget.id, None)
+        return (callback is not None) and (type(callback).compute_mask is not BokehFilters.compute_mask)
+
+
+    def legacy_widgets(self, widgets):
+        '''
+        Returns the widgets whose callbacks filter the (intermediately filtered) data themselves, i.e., they must be re-triggered on each change.
+        '''
+        return [widget for widget in widgets if not self.is_mask_based(widget)]
+
+
+    def invalidate(self, widget_id):
+        '''
+        Marks the mask of a widget as outdated, i.e., its value has changed.
+        '''
+        with self.lock:
+            self.dirty.add(widget_id)
+
+
+    def refresh(self):
+        '''
+        Recomputes the masks of the outdated widgets (w.r.t. their current values) and returns the conjunction of the cached masks.
+        '''
+        with self.lock:
+            for widget_id in list(self.dirty):
+                self.set_mask(widget_id, self.callbacks[widget_id].compute_mask())
+            
+            self.dirty.clear()
+            return self.combine()
+
+
+    def set_mask(self, widget_id, mask):
+        '''
+        Caches the mask of a widget (None if the widget does not filter any row).
+        '''
+        if mask is None:
+            self.masks.pop(widget_id, None)
+        else:
+            self.masks[widget_id] = np.asarray(mask, dtype=bool)
+
+
+    def combine(self):
+        '''
+        Returns the conjunction of the cached masks (None if no mask is set).
+        '''
+        masks = list(self.masks.values())
+
+        if not masks:
+            return None
+        
+        combined = masks[0].copy()
+        for mask in masks[1:]:
+            np.logical_and(combined, mask, out=combined)
+
+        return combined
+
+
+    def append(self, n_rows):
+        '''
+        Extends the cached masks with ```n_rows``` (new) rows and marks the masks of every (mask-based) widget as outdated, 
+        so that the new rows are checked against the filters' current values on the next refresh.
+        '''
+        with self.lock:
+            self.masks = {widget_id: np.append(mask, np.ones(n_rows, dtype=bool)) for widget_id, mask in self.masks.items()}
+            self.dirty.update(widget_id for widget_id, callback in self.callbacks.items() if type(callback).compute_mask is not BokehFilters.compute_mask)
+
+
+    def trim(self, n_rows):
+        '''
+        Keeps the last ```n_rows``` rows of the cached masks.
+        '''
+        with self.lock:
+            self.masks = {widget_id: mask[-n_rows:] for widget_id, mask in self.masks.items()}
+
+
+    def reset(self):
+        '''
+        Drops the cached masks (e.g., when a new dataset is loaded).
+        '''
+        with self.lock:
+            self.masks = {}
+            self.dirty.clear()
+
+
 class BokehFilters:
     __metaclass__ = abc.ABCMeta
 
@@ -29,13 +151,94 @@ class BokehFilters:
         '''
         if not self.vsn_instance.aquire_canvas_data:
             self.vsn_instance.aquire_canvas_data = self.widget.id
+
+            # The filters that compute a mask are not re-triggered; their (cached) masks are applied at once
+            combined = self.vsn_instance.filter_engine.refresh()
+            if combined is not None:
+                self.vsn_instance.canvas_data = self.vsn_instance.data.loc[combined]
             
-            for widget in self.vsn_instance.widgets:
+            for widget in self.vsn_instance.filter_engine.legacy_widgets(self.vsn_instance.widgets):
                 if not widget.id == self.widget.id:
                     widget_callback_policy = list(widget._callbacks.keys())[0] 
                     widget.trigger(widget_callback_policy, None, widget.value)
 
 
+    def callback_update_mask(self):
+        '''
+        Recomputes (only) the widget's mask and renders the rows that satisfy all the filters of the VISIONS instance. 
+        The widgets whose callbacks do not compute a mask (e.g., custom callback classes) are triggered afterwards, in order to filter the remaining rows.
+        If asynchronous filtering is enabled (and all widgets compute a mask), the rows are filtered and prepared on a worker thread.
+        '''
+        engine = self.vsn_instance.filter_engine
+        engine.invalidate(self.widget.id)
+
+        # Triggered by another widget (that does not compute a mask); filter the intermediate data instead
+        if self.vsn_instance.aquire_canvas_data:
+            engine.refresh()
+            mask = engine.masks.get(self.widget.id, None)
+
+            new_pts = self.get_data()
+            new_pts = new_pts if mask is None else self.filter_rows(new_pts, mask)
+            
+            self.callback_prepare_data(new_pts, self.widget.id==self.vsn_instance.aquire_canvas_data)
+            return
+
+        legacy_widgets = engine.legacy_widgets(self.vsn_instance.widgets)
+
+        if not legacy_widgets and self.vsn_instance.async_filtering is not None:
+            self.vsn_instance.submit_filter_request(self)
+            return
+
+        combined = engine.refresh()
+        new_pts = self.vsn_instance.data if combined is None else self.vsn_instance.data.loc[combined]
+
+        if not legacy_widgets:
+            self.vsn_instance.aquire_canvas_data = self.widget.id
+            self.callback_prepare_data(new_pts, True)
+        else:
+            # The last of the remaining widgets renders the data
+            self.vsn_instance.aquire_canvas_data = legacy_widgets[-1].id
+            self.vsn_instance.canvas_data = new_pts
+
+            for widget in legacy_widgets:
+                widget_callback_policy = list(widget._callbacks.keys())[0] 
+                widget.trigger(widget_callback_policy, None, widget.value)
+
+
+    def callback_filter_request(self, request):
+        '''
+        Filters and prepares the data of an (asynchronous) filtering request. Runs on a worker thread, hence it must not modify the Bokeh document.
+        '''
+        engine = self.vsn_instance.filter_engine
+
+        # The loaded dataset and the masks must not change (e.g., by streaming) while the masks are being combined
+        with engine.lock:
+            data = self.vsn_instance.data
+            combined = engine.refresh()
+        
+        new_pts = data if combined is None else data.loc[combined]
+
+        # The rows become active only when the request is rendered (i.e., if it is not superseded)
+        request.active_index = new_pts.index
+        request.canvas_data = self.vsn_instance.prepare_data(new_pts, track_active=False)
+
+
+    def callback_apply_request(self, request):
+        '''
+        Renders the output of an (asynchronous) filtering request. Runs on the Bokeh document's event loop.
+        '''
+        self.vsn_instance.active_index = request.active_index
+        self.callback_render_data(request.canvas_data)
+
+
+    def compute_mask(self):
+        '''
+        Returns the boolean mask (over the rows of the loaded dataset) that corresponds to the widget's current value, or None if the widget does not filter any row.
+        Callback classes that implement this method (and call ```callback_update_mask```) are combined via the filter engine of the VISIONS instance, instead of re-triggering the other widgets.
+        '''
+        raise NotImplementedError
+
+
     def get_data(self):
         '''
         Fetches the data. If the lock is aquired:
@@ -50,6 +253,16 @@ class BokehFilters:
             return self.vsn_instance.data
 
 
+    def filter_rows(self, data, rows):
+        '''
+        Filters (either the loaded or the intermediately filtered) data with the output of a filter index, i.e., either a boolean mask or (sorted) row positions over the loaded dataset.
+        '''
+        if data is self.vsn_instance.data:
+            return data.loc[rows] if rows.dtype == bool else data.iloc[rows]
+
+        return data.loc[data.index.isin(self.vsn_instance.data.index[rows])]
+
+
     def callback_prepare_data(self, new_pts, ready_for_output):
         '''
         Preparing the Filtered data prior to rendering (i.e., passing them to the CDS). 
@@ -59,18 +272,24 @@ class BokehFilters:
 
         if ready_for_output:
             self.vsn_instance.canvas_data = self.vsn_instance.prepare_data(self.vsn_instance.canvas_data)
-
-            if (self.vsn_instance.cmap is not None) and (isinstance(self.vsn_instance.cmap['transform'], bokeh_mdl.CategoricalColorMapper)):
-                factors = sorted(self.vsn_instance.canvas_data[self.vsn_instance.cmap['field']].unique().tolist())
-                self.vsn_instance.cmap['transform'].factors = factors
-
-            self.vsn_instance.source.data = self.vsn_instance.canvas_data.drop(self.vsn_instance.canvas_data.geometry.name, axis=1).to_dict(orient="list")
+            self.callback_render_data(self.vsn_instance.canvas_data)
 
             # print ('Releasing Lock...')
             self.vsn_instance.canvas_data = None
             self.vsn_instance.aquire_canvas_data = None
 
 
+    def callback_render_data(self, canvas_data):
+        '''
+        Passes the prepared data to the CDS (updating the categorical colormap's factors, if any).
+        '''
+        if (self.vsn_instance.cmap is not None) and (isinstance(self.vsn_instance.cmap['transform'], bokeh_mdl.CategoricalColorMapper)):
+            factors = sorted(canvas_data[self.vsn_instance.cmap['field']].unique().tolist())
+            self.vsn_instance.cmap['transform'].factors = factors
+
+        self.vsn_instance.update_source(canvas_data, delta=True)
+
+
     @abc.abstractmethod
     def callback(self, attr, old, new):
         pass
\ No newline at end of file
@@ -0,0 +1,71 @@
+import sys, os
+import timeit
+import numpy as np
+import shapely.geometry
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+import geom_helper as viz_helper
+
+# TO EXECUTE SCRIPT USE
+# python examples/py/bench_multigeom.py
+
+
+def multiGeomHandler_legacy(multi_geometry, coord_index, geom_type, complex_geom=False):
+    '''
+        The previous (quadratic) version of ```geom_helper.multiGeomHandler```, kept for reference.
+    '''
+    for i, part in enumerate(getattr(multi_geometry, 'geoms', multi_geometry)):
+        if i == 0:
+            if geom_type == "MultiPoint":
+                coord_arrays = np.append(viz_helper.getPointCoords(part, coord_index), np.nan)
+            elif geom_type == "MultiLineString":
+                coord_arrays = np.append(viz_helper.getLineCoords(part, coord_index), np.nan)
+            elif geom_type == "MultiPolygon":
+                if complex_geom:
+                    coord_arrays = [viz_helper.getPolyCoords(part, coord_index, complex_geom)]
+                else:
+                    coord_arrays = np.append(viz_helper.getPolyCoords(part, coord_index, complex_geom), np.nan)
+        else:
+            if geom_type == "MultiPoint":
+                coord_arrays = np.concatenate([coord_arrays, np.append(viz_helper.getPointCoords(part, coord_index), np.nan)])
+            elif geom_type == "MultiLineString":
+                coord_arrays = np.concatenate([coord_arrays, np.append(viz_helper.getLineCoords(part, coord_index), np.nan)])
+            elif geom_type == "MultiPolygon":
+                if complex_geom:
+                    coord_arrays += [viz_helper.getPolyCoords(part, coord_index, complex_geom)]
+                else:
+                    coord_arrays = np.concatenate([coord_arrays, np.append(viz_helper.getPolyCoords(part, coord_index, complex_geom), np.nan)])
+
+    if geom_type == "MultiPolygon" and complex_geom:
+        coord_arrays = np.array(viz_helper.concatPolyCoords(coord_arrays)).reshape(1,-1)
+
+    return coord_arrays
+
+
+### Creating synthetic Multi-geometries with many parts
+rng = np.random.default_rng(42)
+n_parts, n_vertices = 5000, 20
+
+centers = rng.uniform(-180, 180, size=(n_parts, 2))
+offsets = rng.uniform(-0.1, 0.1, size=(n_parts, n_vertices, 2))
+
+multi_geometries = {
+    'MultiPoint': shapely.geometry.MultiPoint([tuple(c) for c in centers]),
+    'MultiLineString': shapely.geometry.MultiLineString([c + o for c, o in zip(centers, offsets)]),
+    'MultiPolygon': shapely.geometry.MultiPolygon([shapely.geometry.Point(*c).buffer(0.05, resolution=4) for c in centers]),
+}
+
+
+### Comparing the two implementations
+for geom_type, multi_geometry in multi_geometries.items():
+    for complex_geom in ([False, True] if geom_type == 'MultiPolygon' else [False]):
+        legacy = multiGeomHandler_legacy(multi_geometry, 0, geom_type, complex_geom)
+        current = viz_helper.multiGeomHandler(multi_geometry, 0, geom_type, complex_geom)
+
+        if not complex_geom:
+            np.testing.assert_array_equal(legacy, current)
+
+        t_legacy = min(timeit.repeat(lambda: multiGeomHandler_legacy(multi_geometry, 0, geom_type, complex_geom), number=1, repeat=3))
+        t_current = min(timeit.repeat(lambda: viz_helper.multiGeomHandler(multi_geometry, 0, geom_type, complex_geom), number=1, repeat=3))
+
+        print (f'{geom_type:<16} (complex_geom={complex_geom!s:<5}, {n_parts} parts): legacy {t_legacy:.4f}s, current {t_current:.4f}s, speedup x{t_legacy/t_current:.1f}')
@@ -96,7 +96,7 @@ class Callback(callbacks.BokehFilters):
             st_viz.cmap['transform'].low = 0 if low == high else low
             st_viz.cmap['transform'].high = high
                     
-            st_viz.source.data = st_viz.canvas_data.drop(st_viz.canvas_data.geometry.name, axis=1).to_dict(orient="list")
+            st_viz.update_source(st_viz.canvas_data)
 
             # print ('Releasing Lock...')
             st_viz.canvas_data = None
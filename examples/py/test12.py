@@ -0,0 +1,91 @@
+import os, sys
+import pandas as pd
+import numpy as np
+
+import bokeh.models as bkhm
+import bokeh.colors as bokeh_colors
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from st_visualizer import st_visualizer
+import geom_helper as viz_helper
+import binning as viz_binning
+import callbacks
+
+# TO EXECUTE SCRIPT USE (ON LOCAL SERVER)
+# python -m bokeh serve --show examples/py/test12.py
+
+
+### Loading GeoLife Dataset
+gdf = pd.read_csv('./data/csv/geolife_trips_cleaned_v2_china_subset.csv', nrows=50000)
+gdf = viz_helper.getGeoDataFrame_v2(gdf, crs='epsg:4326')
+
+
+### Creating and Populating the Choropleth (Hexagonal Grid) Map -- No Spatial Join Required
+bbox = gdf.total_bounds
+hex_size = 0.35
+
+choropleth = viz_binning.hexbin_aggregate(gdf, hex_size, bbox=bbox)
+
+st_viz = st_visualizer(limit=len(choropleth))
+st_viz.set_data(choropleth)
+
+st_viz.create_canvas(title=f'Prototype Plot', sizing_mode='scale_width', plot_height=540, tools="pan,box_zoom,lasso_select,wheel_zoom,previewsave,reset")
+st_viz.add_map_tile('CARTODBPOSITRON')
+
+st_viz.add_numerical_colormap('Viridis256', 'count', colorbar=True, cb_orientation='vertical', cb_location='right', label_standoff=12, border_line_color=None, location=(0,0), nan_color=bokeh_colors.RGB(1,1,1,0))
+st_viz.add_polygon(fill_color=st_viz.cmap, line_color=st_viz.cmap, fill_alpha=0.6, muted_alpha=0, legend_label=f'GPS Locations (Hexbin Choropleth)')
+
+
+data_points = st_visualizer(limit=len(gdf))
+data_points.set_data(gdf)
+data_points.set_figure(st_viz.figure)
+
+
+categorical_name='label'
+
+class Callback(callbacks.BokehFilters):
+    def __init__(self, vsn_instance, widget):
+        super().__init__(vsn_instance, widget)
+
+
+    def callback_prepare_data(self, new_pts, ready_for_output):
+        self.vsn_instance.canvas_data = new_pts
+
+        if ready_for_output:
+            # Re-bin the filtered points (on the same grid) instead of intersecting them with every cell
+            st_viz.canvas_data = viz_binning.hexbin_aggregate(self.vsn_instance.canvas_data.to_crs(gdf.crs), hex_size, bbox=bbox).to_crs(st_viz.proj)
+            st_viz.canvas_data = st_viz.prepare_data(st_viz.canvas_data)
+
+            low, high = st_viz.canvas_data[st_viz.cmap['field']].agg([np.min, np.max])
+            st_viz.cmap['transform'].low = 0 if low == high else low
+            st_viz.cmap['transform'].high = high
+
+            st_viz.update_source(st_viz.canvas_data)
+
+            st_viz.canvas_data = None
+            self.vsn_instance.canvas_data = None
+            self.vsn_instance.aquire_canvas_data = None
+
+
+    def callback(self, attr, old, new):
+        self.callback_filter_data()
+
+        cat_value = self.widget.value
+        new_pts = self.get_data()
+
+        if cat_value:
+            new_pts = new_pts.loc[new_pts[categorical_name] == cat_value].copy()
+
+        self.callback_prepare_data(new_pts, self.widget.id==self.vsn_instance.aquire_canvas_data)
+
+
+data_points.add_categorical_filter(title='Vehicle', categorical_name=categorical_name, height_policy='min', callback_class=Callback)
+
+
+### Camera, Lights, Action
+data_points.figure.legend.location = "top_left"
+data_points.figure.legend.click_policy = "mute"
+data_points.figure.toolbar.active_scroll = data_points.figure.select_one(bkhm.WheelZoomTool)
+
+
+data_points.show_figures(notebook=False)
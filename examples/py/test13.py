@@ -0,0 +1,42 @@
+import sys, os
+from bokeh.models import WheelZoomTool
+from bokeh.io import curdoc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from st_visualizer import st_visualizer
+import streaming
+
+# TO EXECUTE SCRIPT USE (ON LOCAL SERVER)
+# python -m bokeh serve --show examples/py/test13.py
+
+
+### Replaying a (day of) AIS Dataset as a Live Feed -- 500 records every second
+feed = streaming.replay_csv('./data/csv/ais_brest_2015-2016.csv', batch_size=500, nrows=30000)
+
+st_viz = st_visualizer(limit=5000)
+st_viz.set_data(next(feed))
+
+st_viz.create_canvas(title=f'Prototype Plot', sizing_mode='stretch_both', plot_width=800, plot_height=600)
+st_viz.add_map_tile('CARTODBPOSITRON')
+
+_ = st_viz.add_glyph(glyph_type='circle', size=10, color='royalblue', alpha=0.7, fill_alpha=0.5, muted_alpha=0, legend_label=f'Vessel GPS Locations')
+
+tooltips = [('Vessel ID','@mmsi'), ('Timestamp','@ts'), ('Speed (knots)','@speed'), ('Coordinates','(@lon, @lat)')]
+st_viz.add_hover_tooltips(tooltips)
+
+st_viz.figure.legend.location = "top_left"
+st_viz.figure.legend.click_policy = "mute"
+st_viz.figure.toolbar.active_scroll = st_viz.figure.select_one(WheelZoomTool)
+
+st_viz.add_temporal_filter(width_policy='fit', step_ms=500, width=800)
+st_viz.show_figures(notebook=False)
+
+
+### Stream each new batch of records (the oldest ones are rolled over, once the CDS holds 5000 records)
+def stream_next_batch():
+    batch = next(feed, None)
+
+    if batch is not None:
+        st_viz.stream_data(batch, rollover=5000)
+
+curdoc().add_periodic_callback(stream_next_batch, 1000)
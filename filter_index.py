@@ -0,0 +1,155 @@
+'''
+	filter_index.py - v2020.05.12
+
+	Authors: Andreas Tritsarolis, Christos Doulkeridis, Yannis Theodoridis and Nikos Pelekis
+'''
+
+
+import numpy as np
+import pandas as pd
+
+
+class FilterIndex:
+    '''
+    Base class of the filters' indexes; a filter index answers queries with row positions over the loaded dataset (of ```size``` rows).
+    '''
+    size = 0
+
+    def to_mask(self, positions):
+        '''
+        Converts row positions to a boolean mask over the rows of the loaded dataset.
+        '''
+        mask = np.zeros(self.size, dtype=bool)
+        mask[positions] = True
+
+        return mask
+
+
+class SortedIndex(FilterIndex):
+    def __init__(self, values):
+        '''
+        Constructor for the SortedIndex Class. Sorts (once) the values of a column, in order to answer range queries via binary search.
+          * values: The (numeric) values of the column, in the order of the loaded dataset's rows
+        '''
+        values = np.asarray(values)
+
+        self.size = len(values)
+        self.order = np.argsort(values, kind='stable')
+        self.values = values[self.order]
+
+        # Missing values (NaN) are sorted last and never satisfy a range/threshold query
+        self.n_valid = self.size - (np.isnan(self.values).sum() if self.values.dtype.kind == 'f' else 0)
+        self.lookup = None
+
+
+    @classmethod
+    def from_temporal(cls, values, unit='s'):
+        '''
+        Create a SortedIndex of timestamps, converted (once) to int64 milliseconds.
+          * values: The temporal values of the column
+          * unit: The unit (e.g., seconds -- s) of the temporal values (if numeric)
+        '''
+        timestamps = pd.to_datetime(values, unit=unit) if pd.api.types.is_numeric_dtype(values) else pd.to_datetime(values)
+        return cls(np.asarray(timestamps, dtype='datetime64[ms]').astype(np.int64))
+
+
+    def range_positions(self, low, high):
+        '''
+        Returns the (unordered) row positions whose values lie within [low, high].
+        '''
+        start = np.searchsorted(self.values[:self.n_valid], low, side='left')
+        end = np.searchsorted(self.values[:self.n_valid], high, side='right')
+
+        return self.order[start:end]
+
+
+    def range_mask(self, low, high):
+        '''
+        Returns a boolean mask (over the rows of the loaded dataset) of the values that lie within [low, high].
+        '''
+        return self.to_mask(self.range_positions(low, high))
+
+
+    def threshold_positions(self, operator, value):
+        '''
+        Returns the (unordered) row positions whose values satisfy a threshold query (i.e., ```operator``` is one of '<', '<=', '>', '>=').
+        '''
+        valid = self.values[:self.n_valid]
+
+        if operator == '<':
+            return self.order[:np.searchsorted(valid, value, side='left')]
+        if operator == '<=':
+            return self.order[:np.searchsorted(valid, value, side='right')]
+        if operator == '>':
+            return self.order[np.searchsorted(valid, value, side='right'):self.n_valid]
+        if operator == '>=':
+            return self.order[np.searchsorted(valid, value, side='left'):self.n_valid]
+
+        raise ValueError(f'Invalid threshold operator: {operator}')
+
+
+    def equal_positions(self, value):
+        '''
+        Returns the (unordered) row positions whose values are equal to ```value```, via a (lazily built) hash of each distinct value to its run of the sorted values.
+        '''
+        if self.lookup is None:
+            distinct, starts, counts = np.unique(self.values[:self.n_valid], return_index=True, return_counts=True)
+            self.lookup = {value: (start, start + count) for value, start, count in zip(distinct.tolist(), starts, counts)}
+
+        start, end = self.lookup.get(value, (0, 0))
+        return self.order[start:end]
+
+
+    def query_mask(self, operator, value):
+        '''
+        Returns a boolean mask (over the rows of the loaded dataset) of the values that satisfy a query, i.e., ```operator``` is either 'range' (```value``` is a (low, high) tuple), 
+        '==', '!=' or a threshold operator.
+        '''
+        if operator == 'range':
+            return self.range_mask(*value)
+        if operator == '==':
+            return self.to_mask(self.equal_positions(value))
+        if operator == '!=':
+            return ~self.to_mask(self.equal_positions(value))
+
+        return self.to_mask(self.threshold_positions(operator, value))
+
+
+class InvertedIndex(FilterIndex):
+    def __init__(self, values):
+        '''
+        Constructor for the InvertedIndex Class. Maps (once) each category of a column to the positions of the rows that contain it.
+          * values: The (categorical) values of the column, in the order of the loaded dataset's rows
+        '''
+        codes, categories = pd.factorize(np.asarray(values, dtype=object))
+
+        self.size = len(codes)
+        self.categories = categories
+
+        # Group the row positions by category (missing values, i.e., code -1, are not indexed)
+        order = np.argsort(codes, kind='stable')
+        self.order = order[codes[order] >= 0]
+        self.offsets = np.append(0, np.cumsum(np.bincount(codes[codes >= 0], minlength=len(categories))))
+        self.lookup = {category: code for code, category in enumerate(categories)}
+
+
+    def positions(self, values):
+        '''
+        Returns the (sorted) row positions that contain any of the given categories.
+          * values: A category or a list of categories
+        '''
+        values = values if isinstance(values, (list, tuple, set, np.ndarray)) else [values]
+        codes = [self.lookup[value] for value in values if value in self.lookup]
+
+        if not codes:
+            return np.array([], dtype=np.int64)
+
+        positions = np.concatenate([self.order[self.offsets[code]:self.offsets[code+1]] for code in codes])
+        return positions if len(codes) == 1 else np.sort(positions)
+
+
+    def mask(self, values):
+        '''
+        Returns a boolean mask (over the rows of the loaded dataset) of the rows that contain any of the given categories.
+        '''
+        return self.to_mask(self.positions(values))
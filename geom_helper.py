@@ -10,9 +10,24 @@
 
 
 import shapely
+import weakref
+import functools
 import numpy as np
-from tqdm import tqdm 
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
 import geopandas as gpd
+from geopandas.array import GeometryArray
+import pyproj
+
+
+# Shapely (>= 2.0) exposes vectorized (array-wise) functions; older versions fall back to the per-geometry methods
+SHAPELY_VECTORIZED = hasattr(shapely, 'get_coordinates')
+
+# The (WGS84) Earth radius of the Web Mercator projection
+WEB_MERCATOR_RADIUS = 6378137.0
+
+# Memoized projections, keyed by the identity of the projected (Geo)DataFrame (entries are dropped along with the DataFrame)
+_PROJECTION_CACHE = {}
 
 
 def concatPolyCoords(polyCoords):
@@ -79,31 +94,32 @@ def multiGeomHandler(multi_geometry, coord_index, geom_type, complex_geom=False)
 	
 	Bokeh documentation regarding the Multi-geometry issues can be found here (it is an open issue) - https://github.com/bokeh/bokeh/issues/2321
 	"""
-	for i, part in enumerate(multi_geometry):
-		# On the first part of the Multi-geometry initialize the coord_array (np.array)
-		if i == 0:
-			if geom_type == "MultiPoint":
-				coord_arrays = np.append(getPointCoords(part, coord_index), np.nan)
-			elif geom_type == "MultiLineString":
-				coord_arrays = np.append(getLineCoords(part, coord_index), np.nan)
-			elif geom_type == "MultiPolygon":
-				if complex_geom:
-					coord_arrays = [getPolyCoords(part, coord_index, complex_geom)]
-				else:
-					coord_arrays = np.append(getPolyCoords(part, coord_index, complex_geom), np.nan)
-		else:
-			if geom_type == "MultiPoint":
-				coord_arrays = np.concatenate([coord_arrays, np.append(getPointCoords(part, coord_index), np.nan)])
-			elif geom_type == "MultiLineString":
-				coord_arrays = np.concatenate([coord_arrays, np.append(getLineCoords(part, coord_index), np.nan)])
-			elif geom_type == "MultiPolygon":
-				if complex_geom:
-					coord_arrays += [getPolyCoords(part, coord_index, complex_geom)]
-				else:
-					coord_arrays = np.concatenate([coord_arrays, np.append(getPolyCoords(part, coord_index, complex_geom), np.nan)])
+	parts = getattr(multi_geometry, 'geoms', multi_geometry)
 
 	if geom_type == "MultiPolygon" and complex_geom:
-		coord_arrays = np.array(concatPolyCoords(coord_arrays)).reshape(1,-1)
+		coord_arrays = concatPolyCoords([getPolyCoords(part, coord_index, complex_geom) for part in parts])
+		return np.array(coord_arrays).reshape(1,-1)
+
+	if SHAPELY_VECTORIZED and not isinstance(multi_geometry, (list, tuple)):
+		coords = getCoordsBulk([multi_geometry])
+
+		if coords is not None:
+			return coords[0][coord_index]
+
+	if geom_type == "MultiPoint":
+		part_coords = [getPointCoords(part, coord_index) for part in parts]
+	elif geom_type == "MultiLineString":
+		part_coords = [getLineCoords(part, coord_index) for part in parts]
+	elif geom_type == "MultiPolygon":
+		part_coords = [getPolyCoords(part, coord_index, complex_geom) for part in parts]
+
+	# Size the output once (each part is followed by a np.nan separator) and fill it in a single pass
+	coord_arrays = np.full(sum(len(coords) for coords in part_coords) + len(part_coords), np.nan)
+
+	start = 0
+	for coords in part_coords:
+		coord_arrays[start:start+len(coords)] = coords
+		start += len(coords) + 1
 
 	# Return the coordinates
 	return coord_arrays
@@ -152,7 +168,97 @@ def getCoords(geom, coord_index, complex_geom=False):
 		return np.array( multiGeomHandler(geom, coord_index, gtype) )
 
 
-def create_linestring_from_points(gdf, column_handlers, **kwargs):
+def getCoordsBulk(geoms, complex_geom=False):
+	"""
+	Vectorized counterpart of ```getCoords```. Extracts both the 'x' and 'y' coordinates of an array of geometries in a single pass,
+	as flat coordinate buffers along with the offsets of each geometry within them. Parts of Multi-geometries are separated with np.nan (as in ```multiGeomHandler```).
+
+	Parameters
+	----------
+	geoms: Array-like of shapely Geometries (e.g., GeoSeries.values)
+		The input Geometries
+	complex_geom: Boolean (default: False)
+		If ```False``` return the Polygons' exterior coordinates, otherwise return both the exterior and interior (i.e., voids/holes) coordinates.
+
+	Returns
+	-------
+		Tuple (buffers, offsets), where ```buffers``` is a List with the 'x' and 'y' coordinate buffers and ```offsets``` a NumPy Array of length ```len(geoms)+1```
+		(None, if every geometry is a Point; in this case the buffers hold one coordinate per geometry).
+		Returns None if the geometries cannot be handled in bulk (i.e., Shapely < 2.0, GeometryCollections, empty/missing geometries or Polygons with ```complex_geom=True```),
+		in which case ```getCoords``` should be used instead.
+	"""
+	if not SHAPELY_VECTORIZED:
+		return None
+
+	geoms = np.asarray(geoms, dtype=object)
+	type_ids = shapely.get_type_id(geoms)
+
+	if len(geoms) != 0 and (type_ids == 0).all() and not shapely.is_empty(geoms).any():
+		return [shapely.get_x(geoms), shapely.get_y(geoms)], None
+
+	# Points, GeometryCollections and missing geometries (-1) cannot be mixed with the ragged output; Polygon holes are nested lists.
+	if np.isin(type_ids, [-1, 0, 7]).any() or (complex_geom and (type_ids == 3).any()):
+		return None
+
+	parts, part_geom = shapely.get_parts(geoms, return_index=True)
+	is_poly = shapely.get_type_id(parts) == 3
+	parts[is_poly] = shapely.get_exterior_ring(parts[is_poly])
+
+	coords, coord_part = shapely.get_coordinates(parts, return_index=True)
+	part_coords = shapely.get_num_coordinates(parts)
+
+	# Every part of a Multi-geometry is followed by a np.nan separator
+	part_len = part_coords + (type_ids[part_geom] >= 4)
+	part_start = np.cumsum(part_len) - part_len
+	coord_start = np.cumsum(part_coords) - part_coords
+
+	buffers = np.full((2, part_len.sum()), np.nan)
+	buffers[:, part_start[coord_part] + np.arange(len(coords)) - coord_start[coord_part]] = coords.T
+
+	offsets = np.zeros(len(geoms) + 1, dtype=np.int64)
+	offsets[1:] = np.cumsum(np.bincount(part_geom, weights=part_len, minlength=len(geoms)))
+
+	return [buffers[0], buffers[1]], offsets
+
+
+def splitCoords(buffer, offsets):
+	"""
+	Split a flat coordinate buffer (as returned by ```getCoordsBulk```) into a per-geometry (object) array of coordinate arrays.
+	The returned arrays are views of ```buffer```, therefore no coordinates are copied.
+	"""
+	coords = np.empty(len(offsets) - 1, dtype=object)
+	if len(coords) == 0:
+		return coords
+
+	for i, arr in enumerate(np.split(buffer, offsets[1:-1])):
+		coords[i] = arr
+
+	return coords
+
+
+def takeCoords(buffer, offsets, positions):
+	"""
+	Take the coordinate arrays of the geometries at ```positions``` from a flat coordinate buffer (as returned by ```getCoordsBulk```), as an (object) array of views of ```buffer```.
+	"""
+	coords = np.empty(len(positions), dtype=object)
+
+	for i, (start, end) in enumerate(zip(offsets[positions], offsets[positions + 1])):
+		coords[i] = buffer[start:end]
+
+	return coords
+
+
+def _build_linestrings(coords, counts):
+	"""
+	Build LineStrings from a (sorted) coordinate array, given the number of consecutive coordinates that belong to each LineString.
+	"""
+	if SHAPELY_VECTORIZED:
+		return list(shapely.linestrings(coords, indices=np.repeat(np.arange(len(counts)), counts)))
+
+	return [shapely.geometry.LineString(part) for part in np.split(coords, np.cumsum(counts)[:-1])] if len(counts) else []
+
+
+def create_linestring_from_points(gdf, column_handlers, temporal_name=None, n_jobs=1, chunksize=1000000, **kwargs):
 	"""
 	Create LineStrings from Point Geometries.
 
@@ -162,19 +268,48 @@ def create_linestring_from_points(gdf, column_handlers, **kwargs):
 		Contains information about the Point Geometries
 	column_handlers: List 
 		The Columns that will Uniquely Identify each LineString (i.e., Primary Key(s))
+	temporal_name: str (default: None)
+		The column that orders the points of each LineString (e.g., the timestamp). If None, the points keep their order within ```gdf```.
+	n_jobs: int (default: 1)
+		The number of worker processes that will build the LineStrings (in chunks of about ```chunksize``` points). If 1, the LineStrings are built in the current process.
+	chunksize: int (default: 1000000)
+		The (approximate) number of points that each chunk of LineStrings will contain (the progress is reported per chunk)
 	**kwargs: Dict
-		Other parameters related to tqdm.pandas
+		Other parameters related to tqdm
 	
 	Returns
 	-------
 	GeoPandas GeoDataFrame
 	"""
+	column_handlers = [column_handlers] if isinstance(column_handlers, str) else list(column_handlers)
 
-	tqdm.pandas(**kwargs)
-	
-	name = gdf.geometry.name
-	linestrings = gdf.groupby(column_handlers, group_keys=False).progress_apply(lambda l: shapely.geometry.LineString(l[name].values) if len(l) >= 2 else shapely.geometry.LineString(np.repeat(l[name].values, 2))).to_frame().reset_index()
-	linestrings.rename({0: 'geom'}, inplace=True, axis=1)
+	# Sort (once) the points by LineString and (optionally) time; rows with missing keys (i.e., NaN group ids) are dropped (as in DataFrame.groupby)
+	group_ids = gdf.groupby(column_handlers, sort=True).ngroup().fillna(-1).astype(np.int64).values
+	order = np.lexsort((group_ids,) if temporal_name is None else (gdf[temporal_name].values, group_ids))
+	order = order[group_ids[order] >= 0]
+
+	counts = np.bincount(group_ids[order])
+
+	# LineStrings with a single point repeat it, in order to form a (degenerate) line
+	order = np.repeat(order, np.where(counts == 1, 2, 1)[group_ids[order]])
+	counts = np.maximum(counts, 2)
+
+	coords = np.column_stack([gdf.geometry.x.values, gdf.geometry.y.values])[order]
+
+	# Split the LineStrings to chunks of (about) ```chunksize``` points
+	group_chunks = [chunk for chunk in np.array_split(np.arange(len(counts)), max(int(np.ceil(len(coords) / chunksize)), 1)) if len(chunk)]
+	coord_offsets = np.append(0, np.cumsum(counts))
+	chunk_args = lambda chunk: (coords[coord_offsets[chunk[0]]:coord_offsets[chunk[-1]+1]], counts[chunk])
+
+	if n_jobs == 1:
+		geoms = [geom for chunk in tqdm(group_chunks, **kwargs) for geom in _build_linestrings(*chunk_args(chunk))]
+	else:
+		with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+			futures = [executor.submit(_build_linestrings, *chunk_args(chunk)) for chunk in group_chunks]
+			geoms = [geom for future in tqdm(futures, **kwargs) for geom in future.result()]
+
+	linestrings = gdf[column_handlers].iloc[order[np.cumsum(counts) - counts]].reset_index(drop=True)
+	linestrings.loc[:, 'geom'] = geoms
 	linestrings = gpd.GeoDataFrame(linestrings, crs=gdf.crs, geometry='geom')
 
 	return linestrings
@@ -186,12 +321,148 @@ def getGeoDataFrame_v2(df, coordinate_columns=['lon', 'lat'], crs='epsg:4326'):
 	'''
 	
 	df.loc[:, 'geom'] = np.nan
-	df.geom = df[coordinate_columns].apply(lambda x: shapely.geometry.Point(*x), axis=1)
+	df.geom = gpd.points_from_xy(*[df[col].values for col in coordinate_columns])
 	
 	return gpd.GeoDataFrame(df, geometry='geom', crs=crs)
 
 
-def classify_area_proximity(trajectories, spatial_areas, compensate=False, buffer_amount=1e-14, verbose=True):
+def from_wkb(values, crs=None, index=None):
+	'''
+		Decode an array of WKB geometries to a GeoSeries (vectorized in GeoPandas >= 0.9; older versions fall back to shapely.wkb).
+	'''
+	if hasattr(gpd.GeoSeries, 'from_wkb'):
+		return gpd.GeoSeries.from_wkb(values, index=index, crs=crs)
+
+	import shapely.wkb
+	return gpd.GeoSeries([None if wkb is None else shapely.wkb.loads(bytes(wkb)) for wkb in values], index=index, crs=crs)
+
+
+def to_wkb(geoms):
+	'''
+		Encode a GeoSeries to an array of WKB geometries (vectorized in GeoPandas >= 0.9; older versions fall back to the per-geometry ```wkb``` property).
+	'''
+	if hasattr(geoms, 'to_wkb'):
+		return geoms.to_wkb().values
+
+	return np.array([None if geom is None else geom.wkb for geom in geoms], dtype=object)
+
+
+@functools.lru_cache(maxsize=None)
+def get_epsg(crs):
+	'''
+		Get the EPSG code of a CRS (None if it has not any).
+	'''
+	return pyproj.CRS.from_user_input(crs).to_epsg()
+
+
+@functools.lru_cache(maxsize=None)
+def get_transformer(from_crs, to_crs):
+	'''
+		Get a (cached) Transformer between two CRS (with x, y -- i.e., lon, lat -- axis order).
+	'''
+	return pyproj.Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
+def project_xy(x, y, from_crs, to_crs):
+	'''
+		Project (vectorized) the coordinates of Points from one CRS to another, without creating any geometry. Returns the projected coordinates as NumPy Arrays.
+		The projection between WGS84 (EPSG:4326) and Web Mercator (EPSG:3857) is computed in closed form; any other is computed by a (cached) pyproj Transformer.
+	'''
+	x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+	from_epsg, to_epsg = get_epsg(from_crs), get_epsg(to_crs)
+
+	if from_epsg is not None and from_epsg == to_epsg:
+		return x.copy(), y.copy()
+
+	if (from_epsg, to_epsg) == (4326, 3857):
+		with np.errstate(divide='ignore'):
+			return WEB_MERCATOR_RADIUS * np.radians(x), WEB_MERCATOR_RADIUS * np.log(np.tan(np.pi / 4 + np.radians(y) / 2))
+
+	if (from_epsg, to_epsg) == (3857, 4326):
+		return np.degrees(x / WEB_MERCATOR_RADIUS), np.degrees(2 * np.arctan(np.exp(y / WEB_MERCATOR_RADIUS)) - np.pi / 2)
+
+	return get_transformer(from_crs, to_crs).transform(x, y)
+
+
+def _memoize_projection(owner, key, inputs, project):
+	'''
+		Memoize a projection of the arrays ```inputs``` (owned by the object ```owner```, e.g., a GeometryArray), so that projecting the same data again (e.g., by a second VISIONS instance) costs nothing.
+		The memoized projection is reused only while ```owner``` is alive and its ```inputs``` are unchanged (i.e., in-place modifications invalidate it).
+	'''
+	cache_key = (id(owner), key)
+	cached = _PROJECTION_CACHE.get(cache_key, None)
+
+	# Geometries are compared by reference first (i.e., a list comparison), while numeric arrays are compared by value (NaNs are equal)
+	snapshot = lambda array: array.tolist() if array.dtype == object else array.copy()
+	unchanged = lambda old, new: old == new.tolist() if isinstance(old, list) else old.shape == new.shape and bool(((old == new) | (np.isnan(old) & np.isnan(new))).all())
+
+	if cached is not None and cached[0]() is owner and all(unchanged(old, new) for old, new in zip(cached[1], inputs)):
+		return cached[2]
+
+	projected = project()
+	_PROJECTION_CACHE[cache_key] = (weakref.ref(owner, lambda _: _PROJECTION_CACHE.pop(cache_key, None)), [snapshot(array) for array in inputs], projected)
+
+	return projected
+
+
+def to_crs(gdf, crs):
+	'''
+		Project a GeoDataFrame to another CRS, by projecting the flat coordinate buffer of its geometries (via ```project_xy```) instead of each geometry.
+		The projected geometries are memoized, while the returned GeoDataFrame is (always) a new one with the current columns of ```gdf```.
+	'''
+	geometry = gdf.geometry.values
+
+	def project():
+		geoms = np.asarray(geometry)
+
+		# 3D geometries are projected by GeoPandas (the transformation of the coordinate buffer is 2D)
+		if gdf.crs is None or not SHAPELY_VECTORIZED or shapely.has_z(geoms).any():
+			return gdf.geometry.to_crs(crs).values
+
+		if get_epsg(gdf.crs) is not None and get_epsg(gdf.crs) == get_epsg(crs):
+			return GeometryArray(geoms, crs=crs)
+
+		# Points are rebuilt from their (projected) coordinates; any other geometry type has its coordinates replaced
+		if (shapely.get_type_id(geoms) == 0).all():
+			coords = shapely.get_coordinates(geoms)
+			geoms = shapely.points(np.column_stack(project_xy(coords[:, 0], coords[:, 1], gdf.crs, crs)))
+		else:
+			geoms = shapely.transform(geoms, lambda xy: np.column_stack(project_xy(xy[:, 0], xy[:, 1], gdf.crs, crs)))
+
+		return GeometryArray(geoms, crs=crs)
+
+	projected = gdf.copy(deep=False)
+	projected[gdf.geometry.name] = gpd.GeoSeries(_memoize_projection(geometry, crs, [np.asarray(geometry)], project).copy(), index=gdf.index)
+
+	return projected
+
+
+def project_columns(df, columns, from_crs, to_crs):
+	'''
+		Project (and memoize) the coordinates of Points, stored in the (ordered) ```columns``` of a DataFrame, from one CRS to another. Returns the projected coordinates as (new) NumPy Arrays.
+	'''
+	x, y = df[columns[0]].values, df[columns[1]].values
+	projected = _memoize_projection(df, (tuple(columns), from_crs, to_crs), [x, y], lambda: project_xy(x, y, from_crs, to_crs))
+
+	return tuple(coords.copy() for coords in projected)
+
+
+def _query_area_proximity(points, areas):
+	"""
+	Match (in bulk) an array of Point Geometries (or their (x, y) coordinates) against the Spatial Areas, using the spatial index (r-tree) of the latter.
+	Returns the positions of the matched points and the respective positions of the spatial areas.
+	"""
+	if isinstance(points, np.ndarray) and points.dtype != object:
+		points = gpd.points_from_xy(points[:, 0], points[:, 1])
+
+	sindex = gpd.GeoSeries(areas).sindex
+	query = sindex.query if SHAPELY_VECTORIZED else sindex.query_bulk
+
+	point_pos, area_pos = query(points, predicate='intersects')
+	return point_pos, area_pos
+
+
+def classify_area_proximity(trajectories, spatial_areas, compensate=False, buffer_amount=1e-14, n_jobs=1, chunksize=500000, verbose=True):
 	"""
 	Classify Point Geometries according to their Spatial Proximity to one (or many) Spatial Area(s).
 
@@ -205,6 +476,10 @@ def classify_area_proximity(trajectories, spatial_areas, compensate=False, buffe
 		Buffer each spatial area by ```buffer_ammount```
 	buffer_ammount: Numeric (default: 1e-14)
 		Buffer ammount for ```spatial_areas``` (if ```compensate = True```)
+	n_jobs: int (default: 1)
+		The number of worker processes that will classify the Point Geometries (in chunks of ```chunksize``` points). If 1, the classification runs in the current process.
+	chunksize: int (default: 500000)
+		The number of Point Geometries that each worker process will classify at a time (if ```n_jobs > 1```)
 	verbose: Boolean (default: True)
 		Enable/Disable Verbosity
 
@@ -212,16 +487,60 @@ def classify_area_proximity(trajectories, spatial_areas, compensate=False, buffe
 	-------
 	GeoPandas GeoDataFrame
 	"""
+	areas = spatial_areas.geometry
+
+	if compensate:
+		areas = areas.buffer(buffer_amount).buffer(0)
+
+	# Spatial Indexes without bulk queries (i.e., rtree-based) classify each spatial area in turn
+	if not (hasattr(areas.sindex, 'query_bulk') or SHAPELY_VECTORIZED):
+		return _classify_area_proximity_iterative(trajectories, areas, verbose=verbose)
 
+	points = np.asarray(trajectories.geometry.values, dtype=object)
+	areas  = np.asarray(areas.values, dtype=object)
+
+	print ('Classifying Spatial Proximity...') if verbose else None
+	if n_jobs == 1:
+		point_pos, area_pos = _query_area_proximity(points, areas)
+	else:
+		# Ship plain coordinates to the worker processes when possible, as they are much cheaper to pickle than geometries
+		if SHAPELY_VECTORIZED and (shapely.get_type_id(points) == 0).all() and not shapely.is_empty(points).any():
+			points = shapely.get_coordinates(points)
+
+		chunk_starts = range(0, len(points), chunksize)
+
+		with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+			futures = [executor.submit(_query_area_proximity, points[start:start+chunksize], areas) for start in chunk_starts]
+			matches = [future.result() for future in tqdm(futures, disable=not verbose)]
+
+		point_pos = np.concatenate([pts + start for (pts, _), start in zip(matches, chunk_starts)]) if matches else np.array([], dtype=np.int64)
+		area_pos  = np.concatenate([ars for _, ars in matches]) if matches else np.array([], dtype=np.int64)
+
+	# If a point lies within many (e.g., adjacent) areas, keep the last one (in the order of ```spatial_areas```)
+	order = np.lexsort((area_pos, point_pos))
+	point_pos, area_pos = point_pos[order], area_pos[order]
+	is_last = np.append(point_pos[1:] != point_pos[:-1], True) if len(point_pos) else np.array([], dtype=bool)
+
+	if 'area_id' not in trajectories.columns:
+		trajectories.loc[:, 'area_id'] = np.nan
+
+	if is_last.any():
+		trajectories.iloc[point_pos[is_last], trajectories.columns.get_loc('area_id')] = spatial_areas.index.values[area_pos[is_last]]
+
+	return trajectories
+
+
+def _classify_area_proximity_iterative(trajectories, areas, verbose=True):
+	"""
+	Classify Point Geometries according to their Spatial Proximity to one (or many) Spatial Area(s), one area at a time.
+	Used when the spatial index does not support bulk queries.
+	"""
 	# create the spatial index (r-tree) of the trajectories's data points
 	print ('Creating Spatial Index...') if verbose else None
 	sindex = trajectories.sindex
 
 	print ('Classifying Spatial Proximity...') if verbose else None
-	for area_id, poly in tqdm(spatial_areas.geometry.items(), disable=not verbose):
-		if compensate:
-			poly = poly.buffer(buffer_amount).buffer(0)
-
+	for area_id, poly in tqdm(areas.items(), disable=not verbose):
 		possible_matches_index = list(sindex.intersection(poly.bounds))
 		possible_matches = trajectories.iloc[possible_matches_index]
 		precise_matches = possible_matches[possible_matches.intersects(poly)]
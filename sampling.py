@@ -0,0 +1,136 @@
+'''
+	sampling.py - v2020.05.12
+
+	Authors: Andreas Tritsarolis, Christos Doulkeridis, Yannis Theodoridis and Nikos Pelekis
+
+	Notes:
+		* Each strategy assigns (once) a priority to every row of the loaded dataset; the rendered sample of any (filtered) subset of the rows
+		  consists of its ```limit``` rows with the lowest priorities (consult ```st_visualizer.set_sampling```).
+'''
+
+
+import numpy as np
+import pandas as pd
+
+
+def head(n):
+	"""
+	The rows' priorities that keep the first rows of the dataset (i.e., the default behaviour of the instance's limit).
+
+	Parameters
+	----------
+	n: int
+		The number of rows of the dataset
+
+	Returns
+	-------
+	NumPy Array
+	"""
+	return np.arange(n, dtype=float)
+
+
+def reservoir(n, seed=None):
+	"""
+	The rows' priorities of a uniform random sample; the rows with the lowest (random) priorities of any subset are a uniform sample (without replacement) of it.
+
+	Parameters
+	----------
+	n: int
+		The number of rows of the dataset
+	seed: int (default: None)
+		The seed of the random number generator
+
+	Returns
+	-------
+	NumPy Array
+	"""
+	return np.random.default_rng(seed).random(n)
+
+
+def stratified(strata, seed=None):
+	"""
+	The rows' priorities of a stratified sample; the rows of each stratum are (randomly) ranked, so that the sample of any subset is split evenly among its strata.
+
+	Parameters
+	----------
+	strata: array-like
+		The stratum (e.g., the object id) of each row
+	seed: int (default: None)
+		The seed of the random number generator
+
+	Returns
+	-------
+	NumPy Array
+	"""
+	codes, _ = pd.factorize(np.asarray(strata))
+	rng = np.random.default_rng(seed)
+
+	# Rank the rows of each stratum in (random) order; the fractional part breaks the ties among the strata
+	order = rng.permutation(len(codes))
+	ranks = np.empty(len(codes), dtype=float)
+	ranks[order] = pd.Series(codes[order]).groupby(codes[order]).cumcount().values
+
+	return ranks + rng.random(len(codes))
+
+
+def grid(x, y, bins=64, bbox=None, seed=None):
+	"""
+	The rows' priorities of a spatially stratified sample, i.e., a stratified sample over the cells of a (```bins``` x ```bins```) grid that covers the dataset.
+
+	Parameters
+	----------
+	x: array-like
+		The x coordinate of each row
+	y: array-like
+		The y coordinate of each row
+	bins: int (default: 64)
+		The number of cells of the grid per dimension
+	bbox: tuple (default: None)
+		The bounding box ```(minx, miny, maxx, maxy)``` of the grid. If None, the bounds of the coordinates are used.
+	seed: int (default: None)
+		The seed of the random number generator
+
+	Returns
+	-------
+	NumPy Array
+	"""
+	x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+	minx, miny, maxx, maxy = (np.nanmin(x), np.nanmin(y), np.nanmax(x), np.nanmax(y)) if bbox is None else bbox
+
+	col = np.clip(((x - minx) / max(maxx - minx, np.finfo(float).eps) * bins), 0, bins - 1)
+	row = np.clip(((y - miny) / max(maxy - miny, np.finfo(float).eps) * bins), 0, bins - 1)
+
+	# Rows with missing coordinates form a stratum of their own
+	cells = np.where(np.isnan(col) | np.isnan(row), -1, np.nan_to_num(row).astype(np.int64) * bins + np.nan_to_num(col).astype(np.int64))
+	return stratified(cells, seed=seed)
+
+
+def temporal(timestamps, bins=100, seed=None):
+	"""
+	The rows' priorities of a time stratified sample, i.e., a stratified sample over ```bins``` (equal-width) intervals of the dataset's temporal extent.
+
+	Parameters
+	----------
+	timestamps: array-like
+		The (numeric or datetime) timestamp of each row
+	bins: int (default: 100)
+		The number of intervals
+	seed: int (default: None)
+		The seed of the random number generator
+
+	Returns
+	-------
+	NumPy Array
+	"""
+	timestamps = pd.Series(timestamps)
+
+	if pd.api.types.is_numeric_dtype(timestamps):
+		values = timestamps.values.astype(float)
+	else:
+		timestamps = pd.to_datetime(timestamps)
+		values = np.where(timestamps.isna(), np.nan, timestamps.values.astype('datetime64[ns]').astype(np.int64))
+
+	start, end = np.nanmin(values), np.nanmax(values)
+
+	intervals = np.clip((values - start) / max(end - start, np.finfo(float).eps) * bins, 0, bins - 1)
+	return stratified(np.where(np.isnan(intervals), -1, np.nan_to_num(intervals).astype(np.int64)), seed=seed)
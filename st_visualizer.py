@@ -6,10 +6,17 @@
 
 
 import sys, os
+import re
+import json
+import hashlib
 import operator
+import threading
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import geopandas as gpd
+import pyproj
 from tqdm import tqdm
 
 import bokeh
@@ -25,20 +32,33 @@ from bokeh.layouts import column, widgetbox, row
 
 # Importing Helper Libraries
 import geom_helper
+import filter_index
 import callbacks
+import sampling
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = pa_compute = pa_feather = pa_parquet = None
 
 
 # Defining Allowed Values (per use-case)
 ALLOWED_BASIC_GLYPH_TYPES = ["asterisk", "circle", "circle_cross", "circle_x", "cross", "dash", 'diamond', 'diamond_cross', 'hex', "inverted_triangle", 'square', 'square_cross', 'square_x', 'triangle']
 ALLOWED_BASIC_POLYGON_TYPES = ['multi_polygons', 'patches']
 ALLOWED_BASIC_LINE_TYPES = ['hline_stack', 'line', 'multi_line', 'step', 'vline_stack']
+POINT_MODE_SUFFIX = '__proj'
+ALLOWED_RASTER_SCALINGS = ['linear', 'log', 'eq_hist']
+ALLOWED_SAMPLING_STRATEGIES = ['head', 'reservoir', 'grid', 'object', 'time']
 ALLOWED_FILTER_OPERATORS = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge, 'range': None}
 ALLOWED_CATEGORICAL_COLOR_PALLETES = ['Accent', 'Blues', 'BrBG', 'BuGn', 'Category10', 'Category20', 'Category20b', 'Category20c', 'Cividis', 'Colorblind', 'Dark2', 'GnBu', 'Greens', 'Greys', 'Inferno', 'Magma','OrRd', 'Oranges', 'PRGn', 'Paired', 'Pastel1', 'Pastel2', 'PiYG', 'Plasma', 'PuBu', 'PuBuGn', 'PuOr', 'PuRd', 'Purples', 'RdBu', 'RdGy', 'RdPu', 'RdYlBu', 'RdYlGn', 'Reds', 'Set1', 'Set2', 'Set3', 'Spectral', 'Turbo', 'Viridis', 'YlGn', 'YlGnBu', 'YlOrBr', 'YlOrRd']
 ALLOWED_NUMERICAL_COLOR_PALETTES = ['Blues256', 'Greens256', 'Greys256', 'Inferno256', 'Magma256', 'Plasma256', 'Viridis256', 'Cividis256', 'Turbo256', 'Oranges256', 'Purples256', 'Reds256']
 
 
 class st_visualizer:
-    def __init__(self, limit=30000, allow_complex_geometries=False, proj='epsg:3857'):
+    def __init__(self, limit=30000, allow_complex_geometries=False, proj='epsg:3857', cache_dir=None, prune_columns=False):
         """
         Constructor for creating a VISIONS Instance.
             
@@ -50,44 +70,196 @@ class st_visualizer:
             Choose to plot either the polygons' exterior (False) or along with its inner voids (True)
         proj: str (default: ```'epsg:3857'```)
             The CRS that the input geometries will be projected to prior to visualization.
+        cache_dir: str (default: None)
+            A directory for caching the preprocessed (i.e., parsed, projected and coordinate-extracted) datasets of the ```get_data_*``` methods, 
+            so that subsequent runs reload them (memory-mapped) instead of preprocessing them anew. If None, no cache is used.
+        prune_columns: boolean (default: False)
+            Pass to the CDS only the columns that are referenced by the Canvas (i.e., by glyphs, tooltips, colormaps and filters -- consult ```st_visualizer.require_columns```),
+            along with the extracted spatial coordinates, instead of every column of the loaded dataset.
         """
         self.limit = limit
         self.allow_complex_geometries = allow_complex_geometries
         self.proj = proj
+        self.cache_dir = cache_dir
+        self.prune_columns = prune_columns
+        self.__filter_state = threading.local()
 
         self.data = None
         self.canvas_data = None
         self.sp_columns = None
+        self.point_mode = False
+        self.coordinates = None
         
         self.figure = None
         self.source = None
 
         self.renderers = []
         self.widgets   = []
+        self.referenced_columns = []
+        self.filter_columns = {}
+        self.filter_indexes = {}
+        self.filter_engine = callbacks.FilterEngine()
 
         self.cmap = None
+        self.lod = None
+        self.viewport = None
+        self.raster = None
+        self.clusters = None
+        self.sampling = None
+        self.delta = None
+        self.lazy_hover = None
+        self.async_filtering = None
+        self.client_filtering = None
         self.__suffix = None
+        self.__pending_callbacks = {}
+        self.active_index = None
+        self.source_index = None
         self.aquire_canvas_data = None
     
 
-    def __set_data(self, data, columns):
+    @property
+    def filter_request(self):
+        """
+        The state (callbacks.FilterRequest) of the filtering request that is handled by the current thread.
+        """
+        if getattr(self.__filter_state, 'request', None) is None:
+            self.__filter_state.request = callbacks.FilterRequest()
+
+        return self.__filter_state.request
+
+
+    @property
+    def aquire_canvas_data(self):
+        """
+        The id of the widget that renders the current filtering request (None if no request is handled).
+        """
+        return self.filter_request.owner
+
+
+    @aquire_canvas_data.setter
+    def aquire_canvas_data(self, value):
+        self.filter_request.owner = value
+
+
+    @property
+    def canvas_data(self):
+        """
+        The intermediately filtered data of the current filtering request.
+        """
+        return self.filter_request.canvas_data
+
+
+    @canvas_data.setter
+    def canvas_data(self, value):
+        self.filter_request.canvas_data = value
+
+
+    def __set_data(self, data, columns, crs=None, projected=False):
         """
         Private Method for Saving the Dataset to the instance's attributes, along with the location of spatial coordinates.
             
         Parameters
         ----------
-        data: GeoPandas GeoDataFrame
-            The instance's loaded data
+        data: GeoPandas GeoDataFrame or Pandas DataFrame
+            The instance's loaded data. If a Pandas DataFrame is given, the instance switches to point mode (i.e., no geometries are created)
         columns: List 
             The (ordered) column names for the location of the spatial coordinates.
+        crs: str (default: None)
+            The CRS of the spatial coordinates (point mode only)
+        projected: boolean (default: False)
+            The data are already projected to the instance's CRS (i.e., loaded from the cache, along with the projected coordinates' columns in point mode)
         """
-        data = data.to_crs(self.proj)
+        self.point_mode = not isinstance(data, gpd.GeoDataFrame)
+        self.sp_columns = columns
+
+        if not projected:
+            data = self.__project_points(data, crs) if self.point_mode else geom_helper.to_crs(data, self.proj)
 
         self.data = data
-        self.sp_columns = columns
+        self.coordinates = None
+        self.lod = None
+        self.active_index = None
+        self.filter_indexes = {}
+        self.filter_engine.reset()
+
+        if self.raster is not None:
+            self.raster['x'], self.raster['y'] = self.__get_point_coords(data)
+
+        if self.clusters is not None:
+            self.__build_clusters()
+
+        if self.sampling is not None:
+            self.__update_sampling()
+
+        if self.lazy_hover is not None:
+            self.lazy_hover['fetch'].cache_clear()
+
+
+    def __project_points(self, data, crs):
+        """
+        Private Method (point mode) that projects the spatial coordinates of ```data``` to the instance's CRS, as (float) columns ```f'{coord_name}{POINT_MODE_SUFFIX}'```.
+        """
+        x, y = geom_helper.project_columns(data, self.sp_columns, crs, self.proj)
+
+        data = data.copy(deep=False)
+        data[f'{self.sp_columns[0]}{POINT_MODE_SUFFIX}'], data[f'{self.sp_columns[1]}{POINT_MODE_SUFFIX}'] = x, y
+
+        return data
 
 
-    def set_data(self, data, sp_columns=['lon', 'lat'], crs='epsg:4326'):
+    def __to_point_data(self, data, sp_columns):
+        """
+        Private Method (point mode) that replaces the Point geometries of a GeoDataFrame with their coordinates (columns ```sp_columns```).
+        """
+        if not isinstance(data, gpd.GeoDataFrame):
+            return data
+
+        x, y = data.geometry.x.values, data.geometry.y.values
+
+        data = pd.DataFrame(data.drop(columns=data.geometry.name))
+        data[sp_columns[0]], data[sp_columns[1]] = x, y
+
+        return data
+
+
+    def get_geometry(self, data=None):
+        """
+        Get the geometries of the loaded (or other prepared) data, in the instance's CRS. In point mode, the Point geometries are created on demand (e.g., for spatial predicates).
+
+        Parameters
+        ----------
+        data: Pandas DataFrame or GeoPandas GeoDataFrame (default: None)
+            Get the geometries of either the loaded data (None) or a subset of it
+
+        Returns
+        -------
+        GeoPandas GeoSeries
+        """
+        data = self.data if data is None else data
+
+        if not self.point_mode:
+            return data.geometry
+
+        x, y = [data[f'{col}{POINT_MODE_SUFFIX}'].values for col in self.sp_columns]
+        return gpd.GeoSeries(gpd.points_from_xy(x, y), index=data.index, crs=self.proj)
+
+
+    def get_bounds(self):
+        """
+        Get the bounds ```(minx, miny, maxx, maxy)``` of the loaded data, in the instance's CRS.
+
+        Returns
+        -------
+        NumPy Array
+        """
+        if not self.point_mode:
+            return self.data.total_bounds
+
+        x, y = [self.data[f'{col}{POINT_MODE_SUFFIX}'].values for col in self.sp_columns]
+        return np.array([np.nanmin(x), np.nanmin(y), np.nanmax(x), np.nanmax(y)])
+
+
+    def set_data(self, data, sp_columns=['lon', 'lat'], crs='epsg:4326', point_mode=False):
         """
         Loading a Dataset to a VISIONS instance.
             
@@ -99,14 +271,20 @@ class st_visualizer:
             The (ordered) column names for the location of the spatial coordinates.
         crs: str (default: ```'epsg:4326'```) 
             The CRS of the Dataset's spatial coordinates
+        point_mode: boolean (default: False)
+            Keep the (projected) spatial coordinates of a Point Dataset as float columns, instead of creating a Point geometry per record. 
+            Geometries are only created on demand (consult ```st_visualizer.get_geometry```)
         """
         if type(data) not in [type(gpd.GeoDataFrame()), type(pd.DataFrame())]:
             raise ValueError('"data" must be either a Pandas DataFrame or a GeoPandas GeoDataFrame')
 
-        if type(data) != type(gpd.GeoDataFrame()):
+        if point_mode:
+            crs = data.crs if isinstance(data, gpd.GeoDataFrame) else crs
+            data = self.__to_point_data(data, sp_columns)
+        elif type(data) != type(gpd.GeoDataFrame()):
             data = geom_helper.getGeoDataFrame_v2(data, coordinate_columns=sp_columns, crs=crs)
         
-        self.__set_data(data, sp_columns)              
+        self.__set_data(data, sp_columns, crs)              
 
 
     def set_figure(self, figure=None):
@@ -133,7 +311,7 @@ class st_visualizer:
         self.source = source
 
 
-    def get_data_csv(self, filepath, sp_columns=['lon', 'lat'], crs='epsg:4326', **kwargs):
+    def get_data_csv(self, filepath, sp_columns=['lon', 'lat'], crs='epsg:4326', point_mode=False, **kwargs):
         """
         Parse a CSV file as a GeoDataFrame.
             
@@ -145,13 +323,201 @@ class st_visualizer:
             The (ordered) list of columns that contain the spatial coordinates
         crs: str (default: ```'epsg:4326'```)  
             The CRS of the Dataset's spatial coordinates
+        point_mode: boolean (default: False)
+            Keep the (projected) spatial coordinates as float columns, instead of creating a Point geometry per record (consult ```st_visualizer.set_data```)
         **kwargs: Dict
             Other arguments related to parsing a CSV file (consult pandas.read_csv method)
         """
+        cache_key = self.__get_cache_key(filepath, sp_columns=sp_columns, crs=crs, point_mode=point_mode, **kwargs)
+        if self.__load_cache(cache_key, sp_columns, crs):
+            return
+
         data = pd.read_csv(filepath, **kwargs)
-        data = geom_helper.getGeoDataFrame_v2(data, coordinate_columns=sp_columns, crs=crs)
+
+        if not point_mode:
+            data = geom_helper.getGeoDataFrame_v2(data, coordinate_columns=sp_columns, crs=crs)
        
-        self.__set_data(data, sp_columns)
+        self.__set_data(data, sp_columns, crs)
+        self.__save_cache(cache_key)
+
+
+    def get_data_parquet(self, filepath, sp_columns=['lon', 'lat'], crs='epsg:4326', columns=None, temporal_name=None, time_window=None, bbox=None, geometry_column=None, filters=None, memory_map=True, point_mode=False, **kwargs):
+        """
+        Parse a Parquet (or GeoParquet) file as a GeoDataFrame, reading (memory-mapped) only the requested columns and the row groups that satisfy the given predicates.
+            
+        Parameters
+        ----------
+        filepath: str
+            The path to the Parquet source file (or dataset directory)
+        sp_columns: List (default: ```['lon', 'lat']```)
+            The (ordered) list of columns that contain the spatial coordinates (ignored if the file contains a geometry column)
+        crs: str (default: ```'epsg:4326'```)  
+            The CRS of the Dataset's spatial coordinates (the CRS of a GeoParquet file's metadata takes precedence)
+        columns: List (default: None)
+            The columns to read. If None, all columns are read
+        temporal_name: str (default: None)
+            The column name that contains the temporal information (required by ```time_window```)
+        time_window: Tuple (default: None)
+            Read only the records within ```(start, end)``` (in the units of ```temporal_name```)
+        bbox: Tuple (default: None)
+            Read only the records within ```(minx, miny, maxx, maxy)``` (in the CRS of the Dataset)
+        geometry_column: str (default: None)
+            The column that contains the (WKB) geometries. If None, the primary geometry column of a GeoParquet file (if any) is used
+        filters: List (default: None)
+            Other predicates, as a list of ```(column, operator, value)``` tuples (consult pyarrow.parquet.read_table method)
+        memory_map: boolean (default: True)
+            Memory-map the source file instead of reading it into memory
+        point_mode: boolean (default: False)
+            Keep the (projected) spatial coordinates as float columns, instead of creating a Point geometry per record (consult ```st_visualizer.set_data```)
+        **kwargs: Dict
+            Other arguments related to parsing a Parquet file (consult pyarrow.parquet.read_table method)
+        """
+        if pa_parquet is None:
+            raise ImportError('Reading Parquet files requires pyarrow.')
+
+        cache_key = self.__get_cache_key(filepath, sp_columns=sp_columns, crs=crs, columns=columns, temporal_name=temporal_name, time_window=time_window, bbox=bbox, 
+                                         geometry_column=geometry_column, filters=filters, point_mode=point_mode, **kwargs)
+        if self.__load_cache(cache_key, sp_columns, crs):
+            return
+
+        # The schema of either a single file or a dataset directory (i.e., of its first file)
+        geo_metadata = self.__get_geo_metadata(pa_parquet.ParquetDataset(filepath, memory_map=memory_map).schema.metadata)
+        geometry_column = geo_metadata.get('primary_column', None) if geometry_column is None else geometry_column
+
+        predicates = self.__get_predicates(sp_columns if geometry_column is None else None, temporal_name, time_window, bbox, filters)
+        columns = self.__get_projection(columns, sp_columns if geometry_column is None else [geometry_column], temporal_name)
+        
+        # Row groups whose statistics do not satisfy the predicates are skipped
+        table = pa_parquet.read_table(filepath, columns=columns, filters=predicates if predicates else None, memory_map=memory_map, **kwargs)
+        crs = geo_metadata.get('crs', crs)
+        data = self.__get_arrow_data(table, sp_columns, crs, geometry_column, bbox, point_mode)
+
+        self.__set_data(data, sp_columns, crs)
+        self.__save_cache(cache_key)
+
+
+    def get_data_feather(self, filepath, sp_columns=['lon', 'lat'], crs='epsg:4326', columns=None, temporal_name=None, time_window=None, bbox=None, geometry_column=None, filters=None, memory_map=True, point_mode=False):
+        """
+        Parse a Feather (Arrow IPC) file as a GeoDataFrame, reading (memory-mapped) only the requested columns and the records that satisfy the given predicates.
+            
+        Parameters
+        ----------
+        filepath: str
+            The path to the Feather source file
+        sp_columns: List (default: ```['lon', 'lat']```)
+            The (ordered) list of columns that contain the spatial coordinates (ignored if ```geometry_column``` is set)
+        crs: str (default: ```'epsg:4326'```)  
+            The CRS of the Dataset's spatial coordinates
+        columns: List (default: None)
+            The columns to read. If None, all columns are read
+        temporal_name: str (default: None)
+            The column name that contains the temporal information (required by ```time_window```)
+        time_window: Tuple (default: None)
+            Read only the records within ```(start, end)``` (in the units of ```temporal_name```)
+        bbox: Tuple (default: None)
+            Read only the records within ```(minx, miny, maxx, maxy)``` (in the CRS of the Dataset)
+        geometry_column: str (default: None)
+            The column that contains the (WKB) geometries
+        filters: List (default: None)
+            Other predicates, as a list of ```(column, operator, value)``` tuples
+        memory_map: boolean (default: True)
+            Memory-map the source file instead of reading it into memory
+        point_mode: boolean (default: False)
+            Keep the (projected) spatial coordinates as float columns, instead of creating a Point geometry per record (consult ```st_visualizer.set_data```)
+        """
+        if pa_feather is None:
+            raise ImportError('Reading Feather files requires pyarrow.')
+
+        cache_key = self.__get_cache_key(filepath, sp_columns=sp_columns, crs=crs, columns=columns, temporal_name=temporal_name, time_window=time_window, bbox=bbox, 
+                                         geometry_column=geometry_column, filters=filters, point_mode=point_mode)
+        if self.__load_cache(cache_key, sp_columns, crs):
+            return
+
+        predicates = self.__get_predicates(sp_columns if geometry_column is None else None, temporal_name, time_window, bbox, filters)
+        columns = self.__get_projection(columns, sp_columns if geometry_column is None else [geometry_column], temporal_name)
+
+        table = pa_feather.read_table(filepath, columns=columns, memory_map=memory_map)
+
+        # Feather files have no row group statistics; the predicates are evaluated (vectorized) on the memory-mapped columns
+        if predicates:
+            operators = {'==': pa_compute.equal, '!=': pa_compute.not_equal, '<': pa_compute.less, '<=': pa_compute.less_equal, '>': pa_compute.greater, '>=': pa_compute.greater_equal}
+            
+            mask = None
+            for column, op, value in predicates:
+                predicate = operators[op](table[column], value)
+                mask = predicate if mask is None else pa_compute.and_(mask, predicate)
+            
+            table = table.filter(mask)
+
+        data = self.__get_arrow_data(table, sp_columns, crs, geometry_column, bbox, point_mode)
+        
+        self.__set_data(data, sp_columns, crs)
+        self.__save_cache(cache_key)
+
+
+    def __get_geo_metadata(self, metadata):
+        """
+        Private Method that parses the GeoParquet metadata (i.e., the primary geometry column and its CRS) of an Arrow schema.
+        """
+        if not metadata or b'geo' not in metadata:
+            return {}
+
+        geo_metadata = json.loads(metadata[b'geo'])
+        primary_column = geo_metadata['primary_column']
+        crs = geo_metadata['columns'][primary_column].get('crs', 'epsg:4326')
+
+        return {'primary_column': primary_column, 'crs': 'epsg:4326' if crs is None else pyproj.CRS.from_user_input(crs)}
+
+
+    def __get_predicates(self, sp_columns, temporal_name, time_window, bbox, filters):
+        """
+        Private Method that translates a time window and a bbox (over the spatial coordinates' columns) to a list of ```(column, operator, value)``` predicates.
+        """
+        predicates = [] if filters is None else list(filters)
+
+        if time_window is not None:
+            if temporal_name is None:
+                raise ValueError('You must set "temporal_name" in order to read a time window.')
+
+            predicates.extend([(temporal_name, '>=', time_window[0]), (temporal_name, '<=', time_window[1])])
+
+        if bbox is not None and sp_columns is not None:
+            minx, miny, maxx, maxy = bbox
+            predicates.extend([(sp_columns[0], '>=', minx), (sp_columns[0], '<=', maxx), (sp_columns[1], '>=', miny), (sp_columns[1], '<=', maxy)])
+
+        return predicates
+
+
+    def __get_projection(self, columns, geometry_columns, temporal_name):
+        """
+        Private Method that adds the spatial (and temporal) columns to the columns that will be read (if projected).
+        """
+        if columns is None:
+            return None
+
+        required = [*geometry_columns, *([] if temporal_name is None else [temporal_name])]
+        return list(columns) + [col for col in required if col not in columns]
+
+
+    def __get_arrow_data(self, table, sp_columns, crs, geometry_column, bbox, point_mode=False):
+        """
+        Private Method that converts an Arrow Table to a GeoDataFrame, decoding (vectorized) either its WKB geometries or its spatial coordinates.
+        In point mode, a DataFrame (with the Points' coordinates) is returned instead.
+        """
+        if geometry_column is None:
+            data = table.to_pandas(split_blocks=True, self_destruct=True)
+            return data if point_mode else geom_helper.getGeoDataFrame_v2(data, coordinate_columns=sp_columns, crs=crs)
+
+        geometries = geom_helper.from_wkb(table[geometry_column].to_numpy(zero_copy_only=False), crs=crs)
+        data = table.drop([geometry_column]).to_pandas(split_blocks=True, self_destruct=True)
+        data[geometry_column] = geometries.values
+        data = gpd.GeoDataFrame(data, geometry=geometry_column, crs=crs)
+
+        if bbox is not None:
+            minx, miny, maxx, maxy = bbox
+            data = data.cx[minx:maxx, miny:maxy]
+
+        return self.__to_point_data(data, sp_columns) if point_mode else data
 
 
     def get_data_postgres(self, sql, con, postgis=True, sp_columns=['lon', 'lat'], crs=None, **kwargs):
@@ -169,6 +535,10 @@ class st_visualizer:
         **kwargs: Dict
             Other arguments related to parsing the SQL Result (consult geopandas.read_postgis method)
         """
+        cache_key = self.__get_cache_key(sql, postgis=postgis, sp_columns=sp_columns, crs=crs, **kwargs)
+        if self.__load_cache(cache_key, sp_columns, crs):
+            return
+
         if postgis:
             data = gpd.read_postgis(sql, con, crs=crs, **kwargs)
         else:
@@ -176,9 +546,172 @@ class st_visualizer:
             data = geom_helper.getGeoDataFrame_v2(data, coordinate_columns=sp_columns, crs=crs)
 
         self.__set_data(data, sp_columns)
+        self.__save_cache(cache_key)
+
+
+    def __get_cache_key(self, source, **params):
+        """
+        Private Method that hashes a data source (i.e., a file's -- or a directory's files' -- path, modification time and size, or an SQL query) along with the preprocessing parameters into a cache key.
+        Returns None if no cache is used.
+        """
+        if self.cache_dir is None:
+            return None
+
+        if pa_feather is None:
+            raise ImportError('Caching the preprocessed datasets requires pyarrow.')
+
+        if os.path.isdir(source):
+            # A dataset directory is described by (the modification time and size of) each of its files
+            files = sorted(os.path.join(root, name) for root, _, names in os.walk(source) for name in names)
+            source = {'path': os.path.abspath(source), 'files': [(os.path.relpath(path, source), os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in files]}
+        elif os.path.exists(source):
+            stat = os.stat(source)
+            source = {'path': os.path.abspath(source), 'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+
+        description = {'source': source, 'params': params, 'proj': self.proj, 'allow_complex_geometries': self.allow_complex_geometries}
+        return hashlib.sha1(json.dumps(description, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+    def __load_cache(self, cache_key, sp_columns, crs):
+        """
+        Private Method that loads a preprocessed dataset from the cache (if present). The data and the extracted coordinates are memory-mapped.
+        Returns True if the dataset was loaded.
+        """
+        if cache_key is None or not os.path.exists(os.path.join(self.cache_dir, f'{cache_key}.json')):
+            return False
+
+        with open(os.path.join(self.cache_dir, f'{cache_key}.json')) as f:
+            metadata = json.load(f)
+
+        data = pa_feather.read_table(os.path.join(self.cache_dir, f'{cache_key}.feather'), memory_map=True).to_pandas(split_blocks=True)
+
+        if metadata['geometry'] is not None:
+            data[metadata['geometry']] = geom_helper.from_wkb(data[metadata['geometry']].values, crs=self.proj, index=data.index)
+            data = gpd.GeoDataFrame(data, geometry=metadata['geometry'], crs=self.proj)
+
+        # The dataset was cached after its projection (in point mode, along with the projected coordinates' columns)
+        self.__set_data(data, sp_columns, crs, projected=True)
+
+        if metadata['coordinates']:
+            load = lambda name: np.asarray(np.load(os.path.join(self.cache_dir, f'{cache_key}_{name}.npy'), mmap_mode='r'))
+            self.coordinates = {'buffers': [load('x'), load('y')], 'offsets': load('offsets') if metadata['offsets'] else None}
+
+        return True
+
+
+    def __save_cache(self, cache_key):
+        """
+        Private Method that stores the loaded (preprocessed) dataset to the cache, i.e., its columns as an (uncompressed) Feather file -- with the geometries as WKB -- 
+        and the extracted coordinates of its geometries as NumPy (.npy) files.
+        """
+        if cache_key is None:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data, coordinates = pd.DataFrame(self.data), None
+
+        if not self.point_mode:
+            geometry_name = self.data.geometry.name
+
+            data = pd.DataFrame(self.data.drop(columns=geometry_name))
+            data.insert(self.data.columns.get_loc(geometry_name), geometry_name, geom_helper.to_wkb(self.data.geometry))
+            coordinates = geom_helper.getCoordsBulk(self.data.geometry.values, self.allow_complex_geometries)
+
+        try:
+            pa_feather.write_feather(pa.Table.from_pandas(data, preserve_index=True), os.path.join(self.cache_dir, f'{cache_key}.feather'), compression='uncompressed')
+        except pa.ArrowException as e:
+            print (f'{e}. The dataset will not be cached.')
+            return
+
+        if coordinates is not None:
+            (x, y), offsets = coordinates
+            for name, values in [('x', x), ('y', y), ('offsets', offsets)]:
+                if values is not None:
+                    np.save(os.path.join(self.cache_dir, f'{cache_key}_{name}.npy'), values)
+
+            self.coordinates = {'buffers': [x, y], 'offsets': offsets}
+
+        # The metadata are written last; an entry without them is incomplete and will be overwritten
+        metadata = {'geometry': None if self.point_mode else self.data.geometry.name, 'coordinates': coordinates is not None, 'offsets': coordinates is not None and coordinates[1] is not None}
+        with open(os.path.join(self.cache_dir, f'{cache_key}.json'), 'w') as f:
+            json.dump(metadata, f)
+
+
+    def set_sampling(self, strategy='reservoir', column=None, bins=None, seed=None):
+        """
+        Set the strategy that selects which (at most ```limit```) rows of the loaded dataset (or of its filtered subset) will be rendered, instead of its first ```limit``` rows.
+        The rows' priorities are computed once (in linear time) whenever a dataset is loaded, and the sample of each (filtered) subset consists of its rows with the lowest priorities.
+
+        Parameters
+        ----------
+        strategy: str (default: 'reservoir')
+            The sampling strategy (allowed values: 'head', 'reservoir', 'grid', 'object', 'time'). 
+                * 'head': The first rows (i.e., the default behaviour)
+                * 'reservoir': A uniform random sample
+                * 'grid': A spatially stratified sample, i.e., the rows are thinned evenly over the cells of a ```bins``` x ```bins``` grid (default: 64)
+                * 'object': A stratified sample per object, i.e., the (same number of) records of each ```column``` (e.g., 'mmsi') value 
+                * 'time': A temporally stratified sample, i.e., the rows are thinned evenly over ```bins``` (default: 100) intervals of the ```column``` (e.g., 'ts') values
+        column: str (default: None)
+            The column of the object ids ('object') or the timestamps ('time')
+        bins: int (default: None)
+            The number of grid cells per dimension ('grid') or temporal intervals ('time'). If None, the strategy's default is used.
+        seed: int (default: None)
+            The seed of the random number generator
+        """
+        if strategy not in ALLOWED_SAMPLING_STRATEGIES:
+            raise ValueError(f'strategy must be one of the following: {ALLOWED_SAMPLING_STRATEGIES}')
+
+        if strategy in ['object', 'time'] and column is None:
+            raise ValueError(f'You must set the column of the {"object ids" if strategy == "object" else "timestamps"} for the "{strategy}" strategy.')
+
+        params = {} if bins is None or strategy not in ['grid', 'time'] else {'bins': bins}
+        self.sampling = {'strategy': strategy, 'column': column, 'params': params, 'seed': seed, 'priority': None}
+
+        if self.data is not None:
+            self.__update_sampling()
+
+        if self.source is not None:
+            self.__refresh_source()
+
+
+    def __update_sampling(self):
+        """
+        Private Method that (re-)computes the priorities of the loaded dataset's rows for the instance's sampling strategy.
+        """
+        strategy, column, params, seed = self.sampling['strategy'], self.sampling['column'], self.sampling['params'], self.sampling['seed']
+
+        if strategy == 'head':
+            priority = sampling.head(len(self.data))
+        elif strategy == 'reservoir':
+            priority = sampling.reservoir(len(self.data), seed=seed)
+        elif strategy == 'grid':
+            priority = sampling.grid(*self.__get_point_coords(self.data), seed=seed, **params)
+        elif strategy == 'object':
+            priority = sampling.stratified(self.data[column].values, seed=seed)
+        else:
+            priority = sampling.temporal(self.data[column].values, seed=seed, **params)
+
+        self.sampling['priority'] = priority
+
+
+    def __get_sample(self, data):
+        """
+        Private Method that returns the (at most ```limit```) rows of ```data``` that will be rendered, i.e., its rows with the lowest priorities (in their original order).
+        If no sampling strategy is set (or ```data``` is not a subset of the loaded dataset), the first ```limit``` rows are returned.
+        """
+        if self.sampling is None or len(data) <= self.limit or not self.data.index.is_unique:
+            return data.iloc[:self.limit]
 
+        positions = np.arange(len(data)) if data is self.data else self.data.index.get_indexer(data.index)
 
-    def prepare_data(self, data=None, suffix=None):
+        if (positions < 0).any():
+            return data.iloc[:self.limit]
+
+        priority = self.sampling['priority'][positions]
+        return data.iloc[np.sort(np.argpartition(priority, self.limit - 1)[:self.limit])]
+
+
+    def prepare_data(self, data=None, suffix=None, track_active=True):
         """
         Prepare the (loaded) data prior to rendering. 
 
@@ -188,6 +721,9 @@ class st_visualizer:
             Prepare either the loaded data (None) or another DataFrame
         suffix: str (default: None)
             A suffix for the column name of the extracted spatial coordinates
+        track_active: boolean (default: True)
+            Keep track of ```data```'s rows as the active (i.e., filtered) rows of the instance. Asynchronous filtering requests are prepared on worker threads without tracking, 
+            as their rows become active only if (and when) they are rendered.
 
 
         Returns
@@ -195,9 +731,17 @@ class st_visualizer:
         GeoPandas GeoDataFrame
         """
         if data is None:
-            data = self.data.copy()
+            data = self.data
+
+        # Keep track of the (filtered) rows, prior to the viewport/limit, in order to refresh the CDS on pan/zoom
+        if track_active:
+            self.active_index = data.index
+
+        if self.viewport is not None:
+            data = data.loc[data.index.isin(self.__get_viewport_index())]
         
-        data = data.iloc[:self.limit].copy()
+        # Copy only the rows (and columns) that will be rendered
+        data = self.__copy_source_columns(self.__get_sample(data))
         
         if suffix is None:
             suffix = self.__suffix
@@ -205,11 +749,51 @@ class st_visualizer:
         if (suffix is None or data is None):
             raise ValueError('You must either set a Dataset and/or set a Column suffix for extracted geometry coordinates.')
         
-        for dim, coord_name in enumerate(self.sp_columns):
-            data.loc[:, f'{coord_name}{suffix}'] = data.geometry.apply(lambda l: geom_helper.getCoords(l, dim, self.allow_complex_geometries))
+        data = self.__extract_coordinates(data, suffix)
 
         # print (data.head())
         return data
+
+
+    def __extract_coordinates(self, data, suffix):
+        """
+        Private Method that extracts the spatial coordinates of ```data```'s geometries to the columns ```f'{coord_name}{suffix}'``` (in-place).
+        """
+        if self.point_mode:
+            for coord_name in self.sp_columns:
+                data.loc[:, f'{coord_name}{suffix}'] = data[f'{coord_name}{POINT_MODE_SUFFIX}'].values
+
+            return data
+
+        # Take the coordinates of the loaded dataset's rows from the (cached) coordinate buffers, if available
+        if self.coordinates is not None and (self.lod is None or self.lod['level'] is None) and self.data.index.is_unique:
+            positions = self.data.index.get_indexer(data.index)
+
+            if (positions >= 0).all():
+                buffers, offsets = self.coordinates['buffers'], self.coordinates['offsets']
+
+                for dim, coord_name in enumerate(self.sp_columns):
+                    data.loc[:, f'{coord_name}{suffix}'] = buffers[dim][positions] if offsets is None else geom_helper.takeCoords(buffers[dim], offsets, positions)
+
+                return data
+
+        # Render the simplified geometries of the active Level-of-Detail (if any)
+        geoms = data.geometry
+        if self.lod is not None and self.lod['level'] is not None:
+            simplified = self.lod['levels'][self.lod['level']].reindex(data.index)
+            geoms = geoms if simplified.isna().any() else simplified
+
+        # Extract the coordinates of all geometries in bulk; fall back to the per-geometry extraction if that is not possible
+        coords = geom_helper.getCoordsBulk(geoms.values, self.allow_complex_geometries)
+
+        for dim, coord_name in enumerate(self.sp_columns):
+            if coords is None:
+                data.loc[:, f'{coord_name}{suffix}'] = geoms.apply(lambda l: geom_helper.getCoords(l, dim, self.allow_complex_geometries))
+            else:
+                buffers, offsets = coords
+                data.loc[:, f'{coord_name}{suffix}'] = buffers[dim] if offsets is None else geom_helper.splitCoords(buffers[dim], offsets)
+
+        return data
  
 
     def create_source(self, suffix='_merc'):
@@ -227,245 +811,1137 @@ class st_visualizer:
         # data_merc = self.data.iloc[:self.limit if limit is None else limit].copy()
         data_merc = self.prepare_data(suffix=suffix)
 
-        source = ColumnDataSource(data_merc.drop([data_merc.geometry.name], axis=1))        
+        source = ColumnDataSource(data=self.get_source_data(data_merc))
         # print (source.to_df())
 
         self.set_source(source)
+        self.source_index = data_merc.index
         self.__suffix = suffix
 
+        if self.delta is not None:
+            self.delta['free'] = np.zeros(len(data_merc), dtype=bool)
 
-    def create_canvas(self, title, x_range=None, y_range=None, suffix='_merc', **kwargs):        
+
+    def get_source_data(self, data):
         """
-        Create the instance's Canvas and CDS.
+        Convert (already prepared) data to the columnar format of the CDS. Numeric, boolean and datetime columns are passed as typed NumPy Arrays and the 
+        extracted coordinates of (Multi)LineStrings/(Multi)Polygons as lists of NumPy Arrays (views of flat coordinate buffers), in order to be sent to the
+        browser via Bokeh's binary array protocol. Any other column is passed as a list.
 
         Parameters
         ----------
-        title: str
-            The Canvas' title. If the limit set at the constructor is less than the length of the loaded data, the title will be suffixed by ``` - Showing {self.limit} out of {len(self.data)} records'```
-        x_range: NumPy Array
-            The Canvas' spatial horizon at the longitude dimension
-        y_range: Numpy Array
-            The Canvas' spatial horizon at the latitude dimension
-        suffix: str (default: ```'_merc'```)
-            A suffix for the column name of the extracted spatial coordinates
-        **kwargs: Dict
-            Other arguments related to creating the instance's Canvas (consult bokeh.plotting.figure method)
+        data: GeoPandas GeoDataFrame (or Pandas DataFrame in point mode)
+            The data to be rendered (as returned by ```prepare_data```)
+
+        Returns
+        -------
+        Dict
         """
-        if self.data is None:
-            raise ValueError('You must set a DataFrame first.')
-        
-        if self.limit < len(self.data):
-            title = f'{title} - Showing {self.limit} out of {len(self.data)} records'
+        source_data = {}
 
-        bbox = self.data.total_bounds
-        if x_range is None:
-            x_range=(np.floor(bbox[0]), np.ceil(bbox[2]))
-        if y_range is None:
-            y_range=(np.floor(bbox[1]), np.ceil(bbox[3]))
+        # The geometries (or, in point mode, the projected coordinates) are passed via the extracted coordinates' columns
+        excluded = [f'{coord_name}{POINT_MODE_SUFFIX}' for coord_name in self.sp_columns] if self.point_mode else []
 
-        fig = figure(x_range=x_range, y_range=y_range, x_axis_type="mercator", y_axis_type="mercator", title=title, **kwargs)
-        
-        self.set_figure(fig)   
-        
-        if self.source is None:
-            self.create_source(suffix)
-           
+        for column_name, column in data.items():
+            if column_name in excluded or column.dtype.name == 'geometry':
+                continue
 
-    def add_categorical_colormap(self, palette, categorical_name, **kwargs):
+            if column.dtype.kind in 'iu' and column.dtype.itemsize == 8:
+                # 64-bit integers are not transferred as binary arrays; downcast them to 32-bit integers or floats (if exact), otherwise pass them as a list
+                values = column.to_numpy()
+                vmin, vmax = (values.min(), values.max()) if len(values) != 0 else (0, 0)
+
+                if vmin >= np.iinfo(np.int32).min and vmax <= np.iinfo(np.int32).max:
+                    source_data[column_name] = values.astype(np.int32)
+                elif vmin >= -2**53 and vmax <= 2**53:
+                    source_data[column_name] = values.astype(np.float64)
+                else:
+                    source_data[column_name] = values.tolist()
+            elif column.dtype.kind in 'biufM':
+                source_data[column_name] = column.to_numpy()
+            elif len(column) != 0 and isinstance(column.iat[0], np.ndarray):
+                source_data[column_name] = list(column.values)
+            else:
+                source_data[column_name] = column.tolist()
+
+        return source_data
+
+
+    def require_columns(self, columns):
         """
-        Create a Categorical Colormap 
-            
+        Declare the columns of the loaded dataset that are referenced by the Canvas (e.g., by glyphs, tooltips, colormaps, filters or custom callbacks). 
+        If the instance prunes the columns of the CDS, the declared columns that are not part of the CDS are added to it.
+
         Parameters
         ----------
-        palette: str or Tuple 
-            The color palette of the colormap. It can either be one of Bokeh's default palettes or a Tuple of colors in hexadecimal format.
-        categorical_name: str 
-            The column name of the loaded dataset that contains the categorical values
-        
-        Returns
-        -------
-        cmap: Dict
-            The Categorical Colormap 
+        columns: List
+            The column names
+        """
+        columns = [col for col in columns if col in self.data.columns and col not in self.referenced_columns]
+        self.referenced_columns.extend(columns)
+
+        if not (self.prune_columns and self.source is not None):
+            return
+
+        missing = [col for col in columns if col not in self.source.data]
+        if missing:
+            for column_name, values in self.get_source_data(self.data[missing].reindex(self.source_index)).items():
+                self.source.add(values, column_name)
+
+
+    def __copy_source_columns(self, data):
+        """
+        Private Method that copies the columns of ```data``` that are passed to the CDS, i.e., either all columns or (if the instance prunes the columns of the CDS) 
+        the referenced columns along with the geometries/coordinates.
+        """
+        if not self.prune_columns:
+            return data.copy()
+
+        if self.point_mode:
+            spatial = [f'{coord_name}{POINT_MODE_SUFFIX}' for coord_name in self.sp_columns]
+        else:
+            spatial = [self.data.geometry.name]
+
+        return data.reindex(columns=[col for col in data.columns if col in self.referenced_columns or col in spatial])
+
+
+    def __require_referenced_columns(self, *values):
+        """
+        Private Method that declares the columns that are referenced by the (data spec) values of a renderer's parameters, i.e., either a field (e.g., a colormap) or a column name.
+        """
+        columns = []
+
+        for value in values:
+            if isinstance(value, dict) and 'field' in value:
+                columns.append(value['field'])
+            elif isinstance(value, str):
+                columns.append(value)
+
+        self.require_columns(columns)
+
+
+    def update_source(self, data, delta=False):
+        """
+        Update the instance's CDS with (already prepared) data.
+
+        Parameters
+        ----------
+        data: GeoPandas GeoDataFrame (or Pandas DataFrame in point mode)
+            The data to be rendered (as returned by ```prepare_data```)
+        delta: boolean (default: False)
+            Send only the rows that entered/left the CDS (if delta updates are enabled -- consult ```st_visualizer.add_delta_updates```), 
+            i.e., the rows of ```data``` that are already rendered are assumed to be unchanged.
+        """
+        if not (delta and self.delta is not None and self.__update_source_delta(data)):
+            self.source.data = self.get_source_data(data)
+            self.source_index = data.index
+
+            if self.delta is not None:
+                self.delta['free'] = np.zeros(len(data), dtype=bool)
+
+        if self.raster is not None:
+            self.__update_raster()
+
+        if self.clusters is not None:
+            self.__update_clusters()
+
+
+    def add_delta_updates(self, threshold=0.25):
+        """
+        Update the CDS (Bokeh Server/Notebook only) with the rows that entered/left it on each filtering request (or pan/zoom, if viewport culling is enabled), 
+        instead of replacing its data. The rows that leave the CDS are hidden in place (by patching their coordinates) and the rows that enter it are streamed, 
+        so that the rest of the rows keep their slots. The data of the CDS are replaced (and the hidden rows are dropped) only if the rows that enter/leave the CDS, 
+        or the hidden rows, exceed ```threshold``` times the rendered rows.
+        Note that the rows of the CDS do not keep the order of the (prepared) data; thus, delta updates are not suitable for order-dependent glyphs (e.g., 'line').
+
+        Parameters
+        ----------
+        threshold: float (default: 0.25)
+            The (maximum) fraction of the rendered rows that is sent as a delta update
+        """
+        if self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        self.delta = {'threshold': threshold, 'free': np.zeros(len(self.source_index), dtype=bool)}
+
+
+    def __update_source_delta(self, data):
+        """
+        Private Method that updates the CDS with the rows of ```data``` that entered/left it (via ```patch```/```stream```). Returns False if the data of the CDS must be replaced instead.
+        """
+        free = self.delta['free']
+
+        if self.source_index is None or free is None or len(free) != len(self.source_index) or not data.index.is_unique:
+            return False
+
+        slots = np.flatnonzero(~free)
+        rendered = self.source_index[slots]
+
+        removed = slots[~rendered.isin(data.index)]
+        added = np.flatnonzero(~data.index.isin(rendered))
+        budget = self.delta['threshold'] * max(len(data), 1)
+
+        if len(removed) + len(added) > budget or free.sum() + len(removed) > budget:
+            return False
+
+        # Hide the rows that left the CDS (their slots are kept, so that the slots of the rest of the rows remain stable)
+        if len(removed) != 0:
+            patches = {}
+
+            for coord_name in self.sp_columns:
+                column_name = f'{coord_name}{self.__suffix}'
+                ragged = isinstance(self.source.data[column_name][removed[0]], (list, np.ndarray))
+
+                # NaN is sent as a string (i.e., scalar NaN values are not JSON serializable), as in Bokeh's own serialization of lists
+                patches[column_name] = [(slot, [] if ragged else 'NaN') for slot in removed.tolist()]
+
+            self.source.patch(patches)
+
+            free = free.copy()
+            free[removed] = True
+
+        # Stream the rows that entered the CDS
+        if len(added) != 0:
+            self.source.stream(self.get_source_data(data.iloc[added]))
+            self.source_index = self.source_index.append(data.index[added])
+            free = np.concatenate([free, np.zeros(len(added), dtype=bool)])
+
+        self.delta['free'] = free
+        return True
+
+
+    def stream_data(self, data, rollover=None, sp_columns=None, crs='epsg:4326', max_records=None):
+        """
+        Append a batch of new records to the loaded dataset and stream them to the CDS (Bokeh Server/Notebook only), without re-processing the already loaded records.
+        The colormap (if any) and the bounds/options of the instance's filters are extended in order to include the new records, while only the new records that pass 
+        the filters' current values are streamed (the rest are kept at the loaded dataset, until the filters are changed). Custom callback classes that do not compute a mask 
+        (i.e., do not implement ```callbacks.BokehFilters.compute_mask```) are not applied to the streamed records.
+
+        Parameters
+        ----------
+        data: Pandas DataFrame or GeoPandas GeoDataFrame
+            The batch of new records (with the same columns as the loaded dataset)
+        rollover: int (default: None)
+            The maximum number of records that will be kept at the CDS (oldest records are discarded first). If None, the instance's limit is used.
+        sp_columns: List (default: None)
+            The (ordered) column names for the location of the spatial coordinates (if ```data``` is a Pandas DataFrame). If None, the instance's spatial columns are used.
+        crs: str (default: ```'epsg:4326'```)
+            The CRS of the batch's spatial coordinates (if ```data``` is a Pandas DataFrame)
+        max_records: int (default: None)
+            The maximum number of (most recent) records that will be kept at the loaded dataset. If None, all records are kept.
+        """
+        if self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        if type(data) not in [type(gpd.GeoDataFrame()), type(pd.DataFrame())]:
+            raise ValueError('"data" must be either a Pandas DataFrame or a GeoPandas GeoDataFrame')
+
+        rollover = self.limit if rollover is None else rollover
+
+        # Project only the new records
+        if self.point_mode:
+            crs = data.crs if isinstance(data, gpd.GeoDataFrame) else crs
+            data = self.__to_point_data(data, self.sp_columns)
+
+            if sp_columns is not None:
+                data = data.rename(columns=dict(zip(sp_columns, self.sp_columns)))
+            
+            data = self.__project_points(data, crs)
+        else:
+            if type(data) != type(gpd.GeoDataFrame()):
+                data = geom_helper.getGeoDataFrame_v2(data, coordinate_columns=self.sp_columns if sp_columns is None else sp_columns, crs=crs)
+
+            data = geom_helper.to_crs(data, self.proj)
+
+            if data.geometry.name != self.data.geometry.name:
+                data = data.rename(columns={data.geometry.name: self.data.geometry.name}).set_geometry(self.data.geometry.name)
+
+        # Continue the (integer) index of the loaded dataset, in order to tell the new records apart
+        if pd.api.types.is_integer_dtype(self.data.index) and len(self.data) != 0:
+            start = self.data.index.max() + 1
+            data.index = pd.RangeIndex(start, start + len(data))
+
+        with self.filter_engine.lock:
+            self.data = pd.concat([self.data, data])
+            self.filter_engine.append(len(data))
+
+            if max_records is not None:
+                self.data = self.data.iloc[-max_records:]
+                self.filter_engine.trim(max_records)
+
+            # The filters' indexes are rebuilt (lazily) over the updated dataset
+            self.filter_indexes = {}
+            self.coordinates = None
+
+            # Check the new records (that are kept at the loaded dataset) against the filters' current values
+            mask = self.filter_engine.refresh()
+
+        n_kept = min(len(data), len(self.data))
+        visible = data.iloc[len(data) - n_kept:]
+
+        if mask is not None:
+            visible = visible.loc[mask[len(mask) - n_kept:]]
+
+        if self.active_index is not None:
+            # Discard the active rows that were trimmed from the loaded dataset
+            if max_records is not None:
+                self.active_index = self.active_index[self.active_index.isin(self.data.index)]
+
+            self.active_index = self.active_index.append(visible.index)
+
+        if self.sampling is not None:
+            self.__update_sampling()
+
+        if self.lod is not None:
+            self.lod['levels'] = [pd.concat([level, data.geometry.simplify(tol)]) for level, tol in zip(self.lod['levels'], self.lod['tolerances'])]
+            self.lod['levels'] = [level.iloc[len(level) - len(self.data):] for level in self.lod['levels']]
+
+        self.__update_stream_bounds(data)
+
+        new_data = self.__extract_coordinates(self.__copy_source_columns(visible), self.__suffix)
+
+        self.source.stream(self.get_source_data(new_data), rollover=rollover)
+        self.source_index = self.source_index.append(visible.index)[-rollover:]
+
+        if self.delta is not None and self.delta['free'] is not None:
+            self.delta['free'] = np.concatenate([self.delta['free'], np.zeros(len(visible), dtype=bool)])[-rollover:]
+
+        if self.raster is not None:
+            self.raster['x'], self.raster['y'] = self.__get_point_coords(self.data)
+            self.__update_raster()
+
+        if self.clusters is not None:
+            self.__build_clusters()
+            self.__update_clusters()
+
+        # A pending (asynchronous) filtering request refers to the previous version of the dataset; submit it anew
+        if self.async_filtering is not None and self.async_filtering['future'] is not None and not self.async_filtering['future'].done():
+            self.submit_filter_request(self.async_filtering['callback'])
+
+
+    def __update_stream_bounds(self, data):
+        """
+        Private Method that extends the colormap (factors or low/high values) and the filters' bounds/options of the instance, in order to include the records of ```data```.
+        """
+        if self.cmap is not None:
+            values, transform = data[self.cmap['field']], self.cmap['transform']
+
+            if isinstance(transform, bokeh_mdl.CategoricalColorMapper):
+                transform.factors = sorted(set(transform.factors) | set(values.unique().tolist()))
+            else:
+                transform.low, transform.high = min(transform.low, values.min()), max(transform.high, values.max())
+
+        as_timestamp = lambda value: pd.to_datetime(value, unit='ms') if isinstance(value, (int, float, np.number)) else pd.Timestamp(value)
+
+        for widget in self.widgets:
+            if widget.id not in self.filter_columns:
+                continue
+
+            spec = self.filter_columns[widget.id]
+            values = data[spec['column']]
+
+            if spec['type'] == 'temporal':
+                widget.start = min(as_timestamp(widget.start), pd.to_datetime(values.min(), unit=spec['unit']))
+                widget.end   = max(as_timestamp(widget.end), pd.to_datetime(values.max(), unit=spec['unit']))
+            elif spec['type'] == 'categorical':
+                new_options = sorted(set(values.unique()) - set(value for value, _ in widget.options))
+                placeholder = [] if spec['multiselect'] else widget.options[:1]
+
+                if new_options:
+                    widget.options = placeholder + sorted(widget.options[len(placeholder):] + [(i, i) for i in new_options])
+            elif spec['type'] == 'numerical':
+                widget.start, widget.end = min(widget.start, values.min()), max(widget.end, values.max())
+
+
+    def create_canvas(self, title, x_range=None, y_range=None, suffix='_merc', **kwargs):        
+        """
+        Create the instance's Canvas and CDS.
+
+        Parameters
+        ----------
+        title: str
+            The Canvas' title. If the limit set at the constructor is less than the length of the loaded data, the title will be suffixed by ``` - Showing {self.limit} out of {len(self.data)} records'```
+        x_range: NumPy Array
+            The Canvas' spatial horizon at the longitude dimension
+        y_range: Numpy Array
+            The Canvas' spatial horizon at the latitude dimension
+        suffix: str (default: ```'_merc'```)
+            A suffix for the column name of the extracted spatial coordinates
+        **kwargs: Dict
+            Other arguments related to creating the instance's Canvas (consult bokeh.plotting.figure method)
+        """
+        if self.data is None:
+            raise ValueError('You must set a DataFrame first.')
+        
+        if self.limit < len(self.data):
+            title = f'{title} - Showing {self.limit} out of {len(self.data)} records'
+
+        bbox = self.get_bounds()
+        if x_range is None:
+            x_range=(np.floor(bbox[0]), np.ceil(bbox[2]))
+        if y_range is None:
+            y_range=(np.floor(bbox[1]), np.ceil(bbox[3]))
+
+        fig = figure(x_range=x_range, y_range=y_range, x_axis_type="mercator", y_axis_type="mercator", title=title, **kwargs)
+        
+        self.set_figure(fig)   
+        
+        if self.source is None:
+            self.create_source(suffix)
+           
+
+    def add_categorical_colormap(self, palette, categorical_name, **kwargs):
+        """
+        Create a Categorical Colormap 
+            
+        Parameters
+        ----------
+        palette: str or Tuple 
+            The color palette of the colormap. It can either be one of Bokeh's default palettes or a Tuple of colors in hexadecimal format.
+        categorical_name: str 
+            The column name of the loaded dataset that contains the categorical values
+        
+        Returns
+        -------
+        cmap: Dict
+            The Categorical Colormap 
+        """
+        if not (isinstance(palette, tuple) or palette in ALLOWED_CATEGORICAL_COLOR_PALLETES):
+            raise ValueError(f'Invalid Palette Name/Tuple. Allowed (pre-built) Palettes: {ALLOWED_CATEGORICAL_COLOR_PALLETES}')
+
+        self.require_columns([categorical_name])
+        categories = sorted(np.unique(self.source.data[categorical_name]).tolist())
+        palette = palette if isinstance(palette, tuple) else getattr(palettes, palette)[len(categories)]
+
+        # print(categories)
+        cmap = bokeh_mdl.CategoricalColorMapper(palette=palette, factors=categories, **kwargs)
+
+        # self.cmap = {'type':'add_categorical_colormap', 'cmap':{'field': categorical_name, 'transform': cmap}}
+        self.cmap = {'field': categorical_name, 'transform': cmap}
+        return self.cmap
+
+    
+    def add_numerical_colormap(self, palette, numeric_name, nan_color='gray', colorbar=True, cb_orientation='vertical', cb_location='right', label_standoff=12, border_line_color=None, location=(0,0), **kwargs): 
+        """
+        Create a Numerical Colormap.
+            
+        Parameters
+        ----------
+        palette: str or Tuple 
+            The color palette of the colormap. It can either be one of Bokeh's default palettes or a Tuple of colors in hexadecimal format.
+        numeric_name: str 
+            The column name of the loaded dataset that contains the numerical values
+        nan_color: str or bokeh.colors instance (default: ```'gray'```)
+            The color name for the geometries that are outside the range of the colormap
+        colorbar: boolean (default: True)
+            Draw a colorbar alongside the Canvas
+        cb_orientation: str (either ```'vertical'```, ```'horizontal'```)
+            The orientation of the colorbar
+        cb_location: str (either ```'left'```, ```'right'```, ```'above'```, ```'below'```)
+            The location of the colorbar relative to the Canvas
+        label_standoff: int (default: 12)
+            The distance (in pixels) to separate the tick labels from the color bar.
+        border_line_color: str or bokeh.colors instance (default: None)
+            The color of the border of the colorbar        
+        location: Tuple (int, int)
+            Adjust the colorbar location relative to ```cb_orientation``` and ```cb_location```
+        **kwargs: Dict
+            Other aarguments related to the creation of the colorbar
+        
+        Returns
+        -------
+        cmap: Dict
+            The Numerical Colormap 
+        """
+        if palette not in ALLOWED_NUMERICAL_COLOR_PALETTES:
+            raise ValueError(f'Invalid Palette Name. Allowed (pre-built) Palettes: {ALLOWED_NUMERICAL_COLOR_PALETTES}')
+
+        self.require_columns([numeric_name])
+
+        min_val, max_val = self.data[numeric_name].agg([np.min, np.max])
+        cmap = bokeh_mdl.LinearColorMapper(palette=getattr(palettes, palette), low=min_val, high=max_val, nan_color=nan_color)
+        
+        if colorbar:
+            cbar = bokeh_mdl.ColorBar(orientation=cb_orientation, color_mapper=cmap, label_standoff=label_standoff, border_line_color=border_line_color, location=location, **kwargs) # Other Params: height=height, width=width
+            self.figure.add_layout(cbar, cb_location)
+
+        # self.cmap = {'type':'add_numerical_colormap', 'cmap':{'field': numeric_name, 'transform': cmap}}
+        self.cmap = {'field': numeric_name, 'transform': cmap}
+        return self.cmap
+
+
+    def add_glyph(self, glyph_type='circle', size=10, color='royalblue', sec_color='lightslategray', alpha=0.7, muted_alpha=0, **kwargs):
+        """
+        Add a Glyph to the Canvas
+            
+        Parameters
+        ----------
+        glyph_type: str (default: ```'circle'```)
+            The Glyph's type
+        size: int (default: 10)
+            The Glyph's size
+        color: str or bokeh.colors instance (default: ```'royalblue'```)
+            The Glyph's primary color
+        sec_color: str or bokeh.colors instance (default: ```'lightslategray'```)
+            The Glyph's secondary color (i.e., the glyph's color when disselected).        
+        alpha:float (values in [0,1] -- default: ```0.7```)
+            The Glyph's overall alpha
+        muted_alpha:float (values in [0,1] -- default: ```0```)
+            The Glyph's alpha when disabled from the legend
+        **kwargs: Dict
+            Other arguments related to the creation of a Glyph
+        
+        Returns
+        -------
+        renderer: Bokeh glyph instance
+            The instance of the added glyph
+        """
+        if glyph_type not in ALLOWED_BASIC_GLYPH_TYPES:
+            raise ValueError(f'glyph_type must be one of the following: {ALLOWED_BASIC_GLYPH_TYPES}')
+
+        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        self.__require_referenced_columns(size, color, sec_color, alpha, *kwargs.values())
+
+        renderer = getattr(self.figure, glyph_type)(*coordinates, size=size, color=color, nonselection_fill_color=sec_color, alpha=alpha, muted_alpha=muted_alpha, source=self.source, **kwargs)
+        self.renderers.append(renderer)
+        self.__set_client_view(renderer)
+
+        return renderer
+
+    
+    def add_line(self, line_type='multi_line', line_color="royalblue", line_width=5, alpha=0.7, muted_alpha=0, **kwargs):
+        """
+        Add a PolyLine to the Canvas
+            
+        Parameters
+        ----------
+        line_type: str (default: ```'multi_line'```)
+            The PolyLine's type
+        line_color: str or bokeh.colors instance (default: ```'royalblue'```)
+            The PolyLine's primary color
+        line_width: int (default: 5)
+            The Polyline's line width
+        alpha:float (values in [0,1] -- default: ```0.7```)
+            The PolyLine's alpha
+        muted_alpha:float (values in [0,1] -- default: ```0```)
+            The Polyline's alpha when disabled from the legend
+        **kwargs: Dict
+            Other arguments related to the creation of a PolyLine
+        
+        Returns
+        -------
+        renderer: Bokeh PolyLine instance
+            The instance of the added PolyLine
+        """
+        if line_type not in ALLOWED_BASIC_LINE_TYPES:
+            raise ValueError(f'line_type must be one of the following: {ALLOWED_BASIC_LINE_TYPES}')
+
+        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        self.__require_referenced_columns(line_color, line_width, alpha, *kwargs.values())
+
+        renderer = getattr(self.figure, line_type)(*coordinates, source=self.source, line_color=line_color, line_width=line_width, alpha=alpha, muted_alpha=muted_alpha, **kwargs)
+        self.renderers.append(renderer)
+        self.__set_client_view(renderer)
+
+        return renderer
+
+
+    def add_polygon(self, polygon_type='patches', line_width=1, line_color='royalblue', fill_color='royalblue', sec_color='lightslategray', fill_alpha=0.5, muted_alpha=0, **kwargs):
+        """
+        Add a Polygon to the Canvas
+            
+        Parameters
+        ----------
+        polygon_type: str (default: ```'patches'```)
+            The Polygon's type
+
+        line_width: int (default: 10)
+            The Polygon's border line width
+
+        line_color: str or bokeh.colors instance (default: ```'royalblue'```)
+            The Polygon's border line color
+
+        fill_color: str or bokeh.colors instance (default: ```'royalblue'```)
+            The Polygon's fill color
+
+        sec_color: str or bokeh.colors instance (default: ```'lightslategray'```)
+            The Polygon's secondary color (i.e., the polygon's color when disselected).  
+
+        fill_alpha:float (values in [0,1] -- default: ```0.5```)
+            The Polygon's inner area alpha value
+
+        muted_alpha:float (values in [0,1] -- default: ```0```)
+            The Polygon's overall alpha when disabled from the legend
+
+        **kwargs: Dict
+            Other arguments related to the creation of a polygon
+        
+        Returns
+        -------
+        renderer: Bokeh polygon instance
+            The instance of the added polygon
+        """
+        if polygon_type not in ALLOWED_BASIC_POLYGON_TYPES:
+            raise ValueError(f'polygon_type must be one of the following: {ALLOWED_BASIC_POLYGON_TYPES}')
+
+        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        self.__require_referenced_columns(line_width, line_color, fill_color, sec_color, fill_alpha, *kwargs.values())
+
+        renderer = getattr(self.figure, polygon_type)(*coordinates, line_width=line_width, line_color=line_color, fill_color=fill_color, nonselection_fill_color=sec_color, fill_alpha=fill_alpha, muted_alpha=muted_alpha, source=self.source, **kwargs)
+        self.renderers.append(renderer)
+        self.__set_client_view(renderer)
+
+        return renderer
+        
+    
+    def add_level_of_detail(self, tolerances=None, n_levels=5, n_coarse_levels=3, pixel_tolerance=1, preserve_topology=True, verbose=False):
+        """
+        Precompute a Level-of-Detail (simplification) pyramid of the loaded (Multi)LineString/(Multi)Polygon geometries (via the Douglas-Peucker algorithm).
+        While the Canvas is panned/zoomed (Bokeh Server only), the CDS is served with the coarsest level whose tolerance does not exceed ```pixel_tolerance``` pixels.
+
+        Parameters
+        ----------
+        tolerances: List (default: None)
+            The simplification tolerances (in the units of the instance's CRS) of the pyramid's levels. If None, the tolerances are derived from the
+            extent of the loaded data, in powers of two of one pixel of the initial Canvas (i.e., one level per zoom-in/out step).
+        n_levels: int (default: 5)
+            The number of levels of the pyramid, starting from one pixel of the initial Canvas and halving at each level (if ```tolerances``` is None)
+        n_coarse_levels: int (default: 3)
+            The number of additional (coarser) levels of ```2**k``` initial pixels (k = 1, ..., ```n_coarse_levels```), served while the Canvas is zoomed out (if ```tolerances``` is None)
+        pixel_tolerance: float (default: 1)
+            The maximum simplification error (in pixels) that is allowed on the Canvas
+        preserve_topology: boolean (default: True)
+            Prevent the simplification from producing invalid geometries (consult shapely.geometry.BaseGeometry.simplify method)
+        verbose: boolean (default: False)
+            Display the progress of the pyramid's construction
+        """
+        if self.figure is None or self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        if self.point_mode:
+            raise ValueError('Level-of-Detail is not available in point mode (Points cannot be simplified).')
+
+        if tolerances is None:
+            minx, _, maxx, _ = self.data.total_bounds
+            tolerances = (maxx - minx) / self.__get_canvas_width() * 2.0 ** np.arange(-(n_levels - 1), n_coarse_levels + 1)
+
+        tolerances = np.sort(np.asarray(tolerances, dtype=float))
+        levels = [self.data.geometry.simplify(tol, preserve_topology=preserve_topology) for tol in tqdm(tolerances, desc='Building LoD Pyramid', disable=not verbose)]
+
+        self.lod = {'tolerances': tolerances, 'levels': levels, 'pixel_tolerance': pixel_tolerance, 'level': None}
+
+        for attr in ['start', 'end']:
+            self.figure.x_range.on_change(attr, self.__update_level_of_detail)
+
+        self.__update_level_of_detail(None, None, None)
+
+
+    def __get_canvas_width(self):
+        """
+        Private Method that returns the (inner) width of the Canvas in pixels.
+        """
+        return getattr(self.figure, 'inner_width', None) or self.figure.plot_width
+
+
+    def __update_level_of_detail(self, attr, old, new):
+        """
+        Private Method (callback) that selects the Level-of-Detail for the Canvas' current spatial horizon, and refreshes the CDS if the level has changed.
+        """
+        if self.lod is None or self.figure.x_range.start is None or self.figure.x_range.end is None:
+            return
+
+        units_per_pixel = (self.figure.x_range.end - self.figure.x_range.start) / self.__get_canvas_width()
+        level = np.searchsorted(self.lod['tolerances'], self.lod['pixel_tolerance'] * units_per_pixel, side='right') - 1
+        level = None if level < 0 else int(level)
+
+        if level != self.lod['level']:
+            self.lod['level'] = level
+            self.__refresh_source()
+
+
+    def __refresh_source(self, delta=False):
+        """
+        Private Method that re-prepares the active (i.e., filtered) rows of the loaded dataset and updates the CDS.
+        """
+        if self.active_index is None or len(self.active_index) == len(self.data):
+            self.update_source(self.prepare_data(self.data), delta=delta)
+        else:
+            self.update_source(self.prepare_data(self.data.loc[self.active_index]), delta=delta)
+
+
+    def add_viewport_culling(self, debounce_ms=250):
+        """
+        Render only the geometries that lie within the Canvas' current spatial horizon (up to the instance's limit), using a spatial index (STR-tree) of the loaded dataset.
+        The CDS is refreshed when the Canvas is panned/zoomed (Bokeh Server only), once the horizon has been stable for ```debounce_ms``` milliseconds.
+
+        Parameters
+        ----------
+        debounce_ms: int (default: 250)
+            The time (in ms) to wait after the last pan/zoom event before refreshing the CDS
+        """
+        if self.figure is None or self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        # Build the spatial index (lazily created and cached by GeoPandas); in point mode, the coordinates are compared directly
+        if not self.point_mode:
+            _ = self.data.sindex
+        
+        self.viewport = {'debounce_ms': debounce_ms}
+
+        for fig_range in [self.figure.x_range, self.figure.y_range]:
+            for attr in ['start', 'end']:
+                fig_range.on_change(attr, self.__schedule_viewport_update)
+
+        self.__refresh_source()
+
+
+    def add_async_filtering(self, max_workers=1):
+        """
+        Filter and prepare the data on a pool of worker threads (Bokeh Server only), so that slow filters do not block the server's event loop. 
+        The output of each request is rendered on the next tick of the document's event loop, while requests that are superseded by a newer one are cancelled (if not started yet) or dropped.
+        Custom callback classes that do not compute a mask (i.e., do not implement ```callbacks.BokehFilters.compute_mask```) are still executed synchronously.
+
+        Parameters
+        ----------
+        max_workers: int (default: 1)
+            The number of worker threads
+        """
+        self.async_filtering = {'executor': ThreadPoolExecutor(max_workers=max_workers), 'generation': 0, 'future': None, 'callback': None}
+
+
+    def submit_filter_request(self, callback):
+        """
+        Submit a filtering request (of a callbacks.BokehFilters instance) to the worker threads, superseding any previously submitted request.
+        """
+        self.async_filtering['generation'] += 1
+        request = callbacks.FilterRequest(owner=callback.widget.id, generation=self.async_filtering['generation'])
+
+        if self.async_filtering['future'] is not None:
+            self.async_filtering['future'].cancel()
+
+        self.async_filtering['callback'] = callback
+        self.async_filtering['future'] = self.async_filtering['executor'].submit(self.__run_filter_request, callback, request, bokeh_io.curdoc())
+
+
+    def __run_filter_request(self, callback, request, doc):
+        """
+        Private Method that handles a filtering request on a worker thread and schedules its rendering on the document's event loop.
+        """
+        if request.generation != self.async_filtering['generation']:
+            return
+
+        self.__filter_state.request = request
+        try:
+            callback.callback_filter_request(request)
+        finally:
+            self.__filter_state.request = None
+
+        if request.generation == self.async_filtering['generation']:
+            doc.add_next_tick_callback(partial(self.__apply_filter_request, callback, request))
+
+
+    def __apply_filter_request(self, callback, request):
+        """
+        Private Method that renders the output of a filtering request, unless it has been superseded in the meantime.
+        """
+        if request.generation != self.async_filtering['generation']:
+            return
+
+        callback.callback_apply_request(request)
+
+
+    def add_client_filtering(self):
+        """
+        Filter the CDS at the browser, i.e., the instance's (default) filters are computed by CustomJS callbacks instead of server callbacks, thus they also work at standalone HTML exports.
+        Each filter is a BooleanFilter of a CDSView that is shared by the instance's renderers (except for renderers of connected glyphs, e.g., 'line'), and its index (i.e., sorted values, 
+        or row positions per category) is computed once over the rows of the CDS and sent to the browser along with the Canvas.
+        Note that the CDS is filtered as is, i.e., the loaded dataset should fit within the instance's limit, while any server-side update of the CDS (e.g., streaming, viewport culling) 
+        is not reflected at the filters' indexes.
+        """
+        if self.figure is None or self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        self.client_filtering = {'view': CDSView(source=self.source, filters=[])}
+
+        for renderer in self.renderers:
+            self.__set_client_view(renderer)
+
+
+    def __set_client_view(self, renderer):
+        """
+        Private Method that filters the rows of a renderer of the CDS via the (shared) CDSView of the instance's client-side filters (if enabled).
+        """
+        if self.client_filtering is None or renderer.data_source is not self.source:
+            return
+
+        # CDSView filters are not supported by glyphs with connected topology
+        if isinstance(renderer.glyph, (bokeh_mdl.Line, bokeh_mdl.Patch, bokeh_mdl.Step)):
+            return
+
+        renderer.view = self.client_filtering['view']
+
+
+    def __add_client_filter(self, widget, callback_policy, spec):
+        """
+        Private Method that connects a filter widget to a BooleanFilter (of the CDSView of the instance's client-side filters), which is computed at the browser from the filter's index.
+        """
+        values = self.data.loc[self.source_index, spec['column']]
+
+        if spec['type'] == 'categorical':
+            index = filter_index.InvertedIndex(values)
+            index_data = {'order': index.order.astype(np.int32)}
+            args = {'categories': index.categories.tolist(), 'offsets': index.offsets.tolist()}
+            code = '''
+                const selected = Array.isArray(widget.value) ? widget.value : [widget.value];
+
+                if (selected.length == 0 || (selected.length == 1 && selected[0] === '')) {
+                    return apply(null);
+                }
+
+                const booleans = new Array(size).fill(false);
+                for (const category of selected) {
+                    const code = categories.indexOf(category);
+                    if (code < 0) { continue; }
+
+                    for (let i = offsets[code]; i < offsets[code + 1]; i++) { booleans[order[i]] = true; }
+                }
+                apply(booleans);
+            '''
+        else:
+            index = filter_index.SortedIndex.from_temporal(values, unit=spec['unit']) if spec['type'] == 'temporal' else filter_index.SortedIndex(values)
+            index_data = {'order': index.order[:index.n_valid].astype(np.int32), 'values': index.values[:index.n_valid].astype(np.float64)}
+            args = {'operator': 'range' if spec['type'] == 'temporal' else spec['operator']}
+            code = '''
+                const values = index.data['values'];
+
+                // The first position of the sorted values that is greater (or equal, if not right) than x
+                function bisect(x, right) {
+                    let low = 0, high = values.length;
+                    while (low < high) {
+                        const mid = (low + high) >> 1;
+                        if (right ? values[mid] <= x : values[mid] < x) { low = mid + 1; } else { high = mid; }
+                    }
+                    return low;
+                }
+
+                const value = widget.value, n = values.length;
+                let start = 0, end = n;
+
+                switch (operator) {
+                    case 'range': start = bisect(value[0], false); end = bisect(value[1], true); break;
+                    case '<': end = bisect(value, false); break;
+                    case '<=': end = bisect(value, true); break;
+                    case '>': start = bisect(value, true); break;
+                    case '>=': start = bisect(value, false); break;
+                    case '==': case '!=': start = bisect(value, false); end = bisect(value, true); break;
+                }
+
+                // Inequality keeps every row (including missing values) except for the equal ones
+                const inverse = operator == '!=';
+                const booleans = new Array(size).fill(inverse);
+                for (let i = start; i < end; i++) { booleans[order[i]] = !inverse; }
+                apply(booleans);
+            '''
+
+        index_source = ColumnDataSource(data=index_data)
+        boolean_filter = BooleanFilter()
+
+        view = self.client_filtering['view']
+        view.filters = [*view.filters, boolean_filter]
+
+        callback = CustomJS(args={'widget': widget, 'index': index_source, 'filter': boolean_filter, 'source': self.source, 'size': len(values), **args}, code='''
+            const order = index.data['order'];
+
+            // Update the filter silently (i.e., it is not synced with the server) and recompute the CDSView
+            function apply(booleans) {
+                filter.setv({booleans: booleans}, {silent: true});
+                source.change.emit();
+            }
+        ''' + code)
+
+        widget.js_on_change(callback_policy, callback)
+        self.widgets.append(widget)
+        self.filter_columns[widget.id] = spec
+
+
+    def __get_viewport_index(self):
+        """
+        Private Method that returns the index of the loaded dataset's rows that intersect with the Canvas' current spatial horizon.
+        """
+        x_range, y_range = self.figure.x_range, self.figure.y_range
+
+        if None in [x_range.start, x_range.end, y_range.start, y_range.end]:
+            return self.data.index
+
+        bounds = (min(x_range.start, x_range.end), min(y_range.start, y_range.end), max(x_range.start, x_range.end), max(y_range.start, y_range.end))
+
+        if self.point_mode:
+            x, y = self.__get_point_coords(self.data)
+            return self.data.index[(x >= bounds[0]) & (x <= bounds[2]) & (y >= bounds[1]) & (y <= bounds[3])]
+
+        positions = np.fromiter(self.data.sindex.intersection(bounds), dtype=np.int64)
+        return self.data.index[np.sort(positions)]
+
+
+    def __schedule_viewport_update(self, attr, old, new):
+        """
+        Private Method (callback) that schedules the refresh of the CDS after a pan/zoom event.
+        """
+        self.__debounce('viewport', partial(self.__refresh_source, delta=True), self.viewport['debounce_ms'])
+
+
+    def __debounce(self, name, callback, delay_ms):
+        """
+        Private Method that (re-)schedules ```callback``` to run after ```delay_ms``` milliseconds on the current document, dropping the previously scheduled callback of the same ```name``` (if still pending).
         """
-        if not (isinstance(palette, tuple) or palette in ALLOWED_CATEGORICAL_COLOR_PALLETES):
-            raise ValueError(f'Invalid Palette Name/Tuple. Allowed (pre-built) Palettes: {ALLOWED_CATEGORICAL_COLOR_PALLETES}')
+        doc = bokeh_io.curdoc()
+        pending = self.__pending_callbacks.pop(name, None)
 
-        categories = sorted(np.unique(self.source.data[categorical_name]).tolist())
-        palette = palette if isinstance(palette, tuple) else getattr(palettes, palette)[len(categories)]
+        if pending is not None:
+            try:
+                doc.remove_timeout_callback(pending)
+            except ValueError:
+                pass
 
-        # print(categories)
-        cmap = bokeh_mdl.CategoricalColorMapper(palette=palette, factors=categories, **kwargs)
+        def debounced_callback():
+            self.__pending_callbacks.pop(name, None)
+            callback()
 
-        # self.cmap = {'type':'add_categorical_colormap', 'cmap':{'field': categorical_name, 'transform': cmap}}
-        self.cmap = {'field': categorical_name, 'transform': cmap}
-        return self.cmap
+        self.__pending_callbacks[name] = doc.add_timeout_callback(debounced_callback, delay_ms)
 
-    
-    def add_numerical_colormap(self, palette, numeric_name, nan_color='gray', colorbar=True, cb_orientation='vertical', cb_location='right', label_standoff=12, border_line_color=None, location=(0,0), **kwargs): 
+
+    def add_raster(self, palette='Viridis256', how='eq_hist', debounce_ms=250, **kwargs):
         """
-        Create a Numerical Colormap.
-            
+        Add a (server-side) Rasterization layer to the Canvas. The (filtered) geometries are binned, at the Canvas' pixel resolution, into a 2D histogram which
+        is colorized and rendered as a single image. Unlike ```add_glyph```, the rasterization is not bounded by the instance's limit; hence it can render millions of points.
+        The image is recomputed when the data are filtered, and on pan/zoom events (Bokeh Server only; once the horizon has been stable for ```debounce_ms``` milliseconds).
+        Non-Point geometries are rasterized by their centroids.
+
         Parameters
         ----------
-        palette: str or Tuple 
-            The color palette of the colormap. It can either be one of Bokeh's default palettes or a Tuple of colors in hexadecimal format.
-        numeric_name: str 
-            The column name of the loaded dataset that contains the numerical values
-        nan_color: str or bokeh.colors instance (default: ```'gray'```)
-            The color name for the geometries that are outside the range of the colormap
-        colorbar: boolean (default: True)
-            Draw a colorbar alongside the Canvas
-        cb_orientation: str (either ```'vertical'```, ```'horizontal'```)
-            The orientation of the colorbar
-        cb_location: str (either ```'left'```, ```'right'```, ```'above'```, ```'below'```)
-            The location of the colorbar relative to the Canvas
-        label_standoff: int (default: 12)
-            The distance (in pixels) to separate the tick labels from the color bar.
-        border_line_color: str or bokeh.colors instance (default: None)
-            The color of the border of the colorbar        
-        location: Tuple (int, int)
-            Adjust the colorbar location relative to ```cb_orientation``` and ```cb_location```
+        palette: str or Tuple (default: ```'Viridis256'```)
+            The color palette of the raster. It can either be one of Bokeh's default (numerical) palettes or a Tuple of colors in hexadecimal format.
+        how: str (default: ```'eq_hist'```)
+            The scaling of the (per-pixel) counts prior to colorization (allowed values: 'linear', 'log', 'eq_hist')
+        debounce_ms: int (default: 250)
+            The time (in ms) to wait after the last pan/zoom event before recomputing the image
         **kwargs: Dict
-            Other aarguments related to the creation of the colorbar
-        
+            Other arguments related to the creation of the image (consult bokeh.plotting.figure.image_rgba method)
+
         Returns
         -------
-        cmap: Dict
-            The Numerical Colormap 
+        renderer: Bokeh image_rgba instance
+            The instance of the added raster
         """
-        if palette not in ALLOWED_NUMERICAL_COLOR_PALETTES:
-            raise ValueError(f'Invalid Palette Name. Allowed (pre-built) Palettes: {ALLOWED_NUMERICAL_COLOR_PALETTES}')
+        if not (isinstance(palette, tuple) or palette in ALLOWED_NUMERICAL_COLOR_PALETTES):
+            raise ValueError(f'Invalid Palette Name/Tuple. Allowed (pre-built) Palettes: {ALLOWED_NUMERICAL_COLOR_PALETTES}')
 
-        min_val, max_val = self.data[numeric_name].agg([np.min, np.max])
-        cmap = bokeh_mdl.LinearColorMapper(palette=getattr(palettes, palette), low=min_val, high=max_val, nan_color=nan_color)
-        
-        if colorbar:
-            cbar = bokeh_mdl.ColorBar(orientation=cb_orientation, color_mapper=cmap, label_standoff=label_standoff, border_line_color=border_line_color, location=location, **kwargs) # Other Params: height=height, width=width
-            self.figure.add_layout(cbar, cb_location)
+        if how not in ALLOWED_RASTER_SCALINGS:
+            raise ValueError(f'how must be one of the following: {ALLOWED_RASTER_SCALINGS}')
 
-        # self.cmap = {'type':'add_numerical_colormap', 'cmap':{'field': numeric_name, 'transform': cmap}}
-        self.cmap = {'field': numeric_name, 'transform': cmap}
-        return self.cmap
+        palette = palette if isinstance(palette, tuple) else getattr(palettes, palette)
+        rgb = np.array([[int(color[i:i+2], 16) for i in (1, 3, 5)] for color in palette], dtype=np.uint32)
 
+        x, y = self.__get_point_coords(self.data)
 
-    def add_glyph(self, glyph_type='circle', size=10, color='royalblue', sec_color='lightslategray', alpha=0.7, muted_alpha=0, **kwargs):
+        self.raster = {
+            'x': x, 'y': y, 'how': how, 'debounce_ms': debounce_ms,
+            'palette': (255 << 24) | (rgb[:, 2] << 16) | (rgb[:, 1] << 8) | rgb[:, 0],
+            'source': ColumnDataSource(data={'image': [], 'x': [], 'y': [], 'dw': [], 'dh': []})
+        }
+
+        renderer = self.figure.image_rgba(image='image', x='x', y='y', dw='dw', dh='dh', source=self.raster['source'], **kwargs)
+        self.renderers.append(renderer)
+
+        for fig_range in [self.figure.x_range, self.figure.y_range]:
+            for attr in ['start', 'end']:
+                fig_range.on_change(attr, lambda attr, old, new: self.__debounce('raster', self.__update_raster, self.raster['debounce_ms']))
+
+        self.__update_raster()
+        return renderer
+
+
+    def __get_point_coords(self, data):
         """
-        Add a Glyph to the Canvas
-            
+        Private Method that returns the (x, y) coordinates of ```data```'s Point geometries (or the centroids of any other geometry type) as NumPy Arrays.
+        """
+        if self.point_mode:
+            return tuple(data[f'{col}{POINT_MODE_SUFFIX}'].values for col in self.sp_columns)
+
+        geoms = data.geometry
+        if not (geoms.geom_type == 'Point').all():
+            geoms = geoms.centroid
+
+        return geoms.x.values, geoms.y.values
+
+
+    def __update_raster(self):
+        """
+        Private Method that rasterizes the active (i.e., filtered) rows of the loaded dataset within the Canvas' current spatial horizon.
+        """
+        x, y = self.raster['x'], self.raster['y']
+
+        if self.active_index is not None and len(self.active_index) != len(self.data):
+            active = self.data.index.isin(self.active_index)
+            x, y = x[active], y[active]
+
+        x_range, y_range = self.figure.x_range, self.figure.y_range
+        x0, x1 = sorted([x_range.start, x_range.end])
+        y0, y1 = sorted([y_range.start, y_range.end])
+
+        width  = int(self.__get_canvas_width())
+        height = int(getattr(self.figure, 'inner_height', None) or self.figure.plot_height)
+
+        counts, _, _ = np.histogram2d(y, x, bins=[height, width], range=[[y0, y1], [x0, x1]])
+        nonzero = counts > 0
+
+        if self.raster['how'] == 'linear':
+            scaled = counts / max(counts.max(), 1)
+        elif self.raster['how'] == 'log':
+            scaled = np.log1p(counts) / np.log1p(max(counts.max(), 1))
+        else:
+            # Histogram equalization: scale each count by its rank among the non-empty pixels
+            values = np.sort(counts[nonzero])
+            scaled = np.searchsorted(values, counts, side='right') / max(len(values), 1)
+
+        palette = self.raster['palette']
+        image = np.where(nonzero, palette[np.clip((scaled * (len(palette) - 1)).astype(int), 0, len(palette) - 1)], 0).astype(np.uint32)
+
+        self.raster['source'].data = {'image': [image], 'x': [x0], 'y': [y0], 'dw': [x1 - x0], 'dh': [y1 - y0]}
+
+
+    def add_clusters(self, n_levels=16, cell_pixels=60, color='royalblue', text_color='white', min_size=12, max_size=48, alpha=0.7, debounce_ms=250, **kwargs):
+        """
+        Add a (server-side) Clustering layer to the Canvas. The (filtered) geometries are clustered via a grid hierarchy (i.e., the cells of each level are split in four at the next one), 
+        and each cluster is rendered as a single circle, which is sized and labelled by the number of its geometries. Unlike ```add_glyph```, the clustering is not bounded by the instance's limit.
+        The hierarchy is built once (in NumPy), while the clusters are selected, at the level whose cells span ```cell_pixels``` pixels, when the data are filtered (incrementally, i.e., 
+        only the rows that entered/left the filtered data are counted) and on pan/zoom events (Bokeh Server only; once the horizon has been stable for ```debounce_ms``` milliseconds).
+        Non-Point geometries are clustered by their centroids.
+
         Parameters
         ----------
-        glyph_type: str (default: ```'circle'```)
-            The Glyph's type
-        size: int (default: 10)
-            The Glyph's size
+        n_levels: int (default: 16)
+            The number of levels of the grid hierarchy; the cells of the first level span the whole extent of the loaded data
+        cell_pixels: float (default: 60)
+            The (approximate) size of each cluster's cell on the Canvas (in pixels)
         color: str or bokeh.colors instance (default: ```'royalblue'```)
-            The Glyph's primary color
-        sec_color: str or bokeh.colors instance (default: ```'lightslategray'```)
-            The Glyph's secondary color (i.e., the glyph's color when disselected).        
+            The clusters' color
+        text_color: str or bokeh.colors instance (default: ```'white'```)
+            The color of the clusters' labels
+        min_size: int (default: 12)
+            The size of a single-geometry cluster (in pixels)
+        max_size: int (default: 48)
+            The size of the largest cluster (in pixels)
         alpha:float (values in [0,1] -- default: ```0.7```)
-            The Glyph's overall alpha
-        muted_alpha:float (values in [0,1] -- default: ```0```)
-            The Glyph's alpha when disabled from the legend
+            The clusters' alpha
+        debounce_ms: int (default: 250)
+            The time (in ms) to wait after the last pan/zoom event before recomputing the clusters
         **kwargs: Dict
-            Other arguments related to the creation of a Glyph
-        
+            Other arguments related to the creation of the clusters' circles (consult bokeh.plotting.figure.circle method)
+
         Returns
         -------
-        renderer: Bokeh glyph instance
-            The instance of the added glyph
+        renderer: Bokeh circle instance
+            The instance of the added clusters' circles
         """
-        if glyph_type not in ALLOWED_BASIC_GLYPH_TYPES:
-            raise ValueError(f'glyph_type must be one of the following: {ALLOWED_BASIC_GLYPH_TYPES}')
+        if self.figure is None or self.source is None:
+            raise ValueError('You must create a Canvas first.')
 
-        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        self.clusters = {
+            'n_levels': n_levels, 'cell_pixels': cell_pixels, 'min_size': min_size, 'max_size': max_size, 'debounce_ms': debounce_ms, 'state': None,
+            'source': ColumnDataSource(data={'x': [], 'y': [], 'count': [], 'size': [], 'label': []})
+        }
+        self.__build_clusters()
 
-        renderer = getattr(self.figure, glyph_type)(*coordinates, size=size, color=color, nonselection_fill_color=sec_color, alpha=alpha, muted_alpha=muted_alpha, source=self.source, **kwargs)
+        renderer = self.figure.circle('x', 'y', size='size', color=color, alpha=alpha, source=self.clusters['source'], **kwargs)
+        self.figure.text('x', 'y', text='label', text_color=text_color, text_align='center', text_baseline='middle', text_font_size='8pt', source=self.clusters['source'])
         self.renderers.append(renderer)
 
+        for fig_range in [self.figure.x_range, self.figure.y_range]:
+            for attr in ['start', 'end']:
+                fig_range.on_change(attr, lambda attr, old, new: self.__debounce('clusters', self.__update_clusters, self.clusters['debounce_ms']))
+
+        self.__update_clusters()
         return renderer
 
-    
-    def add_line(self, line_type='multi_line', line_color="royalblue", line_width=5, alpha=0.7, muted_alpha=0, **kwargs):
+
+    def __build_clusters(self):
         """
-        Add a PolyLine to the Canvas
-            
-        Parameters
-        ----------
-        line_type: str (default: ```'multi_line'```)
-            The PolyLine's type
-        line_color: str or bokeh.colors instance (default: ```'royalblue'```)
-            The PolyLine's primary color
-        line_width: int (default: 5)
-            The Polyline's line width
-        alpha:float (values in [0,1] -- default: ```0.7```)
-            The PolyLine's alpha
-        muted_alpha:float (values in [0,1] -- default: ```0```)
-            The Polyline's alpha when disabled from the legend
-        **kwargs: Dict
-            Other arguments related to the creation of a PolyLine
-        
-        Returns
-        -------
-        renderer: Bokeh PolyLine instance
-            The instance of the added PolyLine
+        Private Method that builds the grid hierarchy of the loaded dataset's rows, i.e., the (compact) cell ids of each row per level.
         """
-        if line_type not in ALLOWED_BASIC_LINE_TYPES:
-            raise ValueError(f'line_type must be one of the following: {ALLOWED_BASIC_LINE_TYPES}')
+        x, y = self.__get_point_coords(self.data)
+        valid = ~(np.isnan(x) | np.isnan(y))
 
-        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        minx, miny, maxx, maxy = (np.nanmin(x), np.nanmin(y), np.nanmax(x), np.nanmax(y)) if valid.any() else (0, 0, 0, 0)
+        extent = max(maxx - minx, maxy - miny, np.finfo(float).eps)
 
-        renderer = getattr(self.figure, line_type)(*coordinates, source=self.source, line_color=line_color, line_width=line_width, alpha=alpha, muted_alpha=muted_alpha, **kwargs)
-        self.renderers.append(renderer)
+        # The cells of the finest level; the cells of each coarser level are derived by shifting out their last bit(s)
+        finest = self.clusters['n_levels'] - 1
+        cx = np.clip(np.nan_to_num((x - minx) / extent * 2 ** finest), 0, 2 ** finest - 1).astype(np.int64)
+        cy = np.clip(np.nan_to_num((y - miny) / extent * 2 ** finest), 0, 2 ** finest - 1).astype(np.int64)
 
-        return renderer
+        levels = []
+        for level in range(self.clusters['n_levels']):
+            cells = ((cx >> (finest - level)) << level) | (cy >> (finest - level))
+            levels.append(np.unique(cells, return_inverse=True)[1].astype(np.int32).ravel())
 
+        self.clusters.update({'x': x, 'y': y, 'valid': valid, 'extent': extent, 'levels': levels, 'state': None})
 
-    def add_polygon(self, polygon_type='patches', line_width=1, line_color='royalblue', fill_color='royalblue', sec_color='lightslategray', fill_alpha=0.5, muted_alpha=0, **kwargs):
+
+    def __update_clusters(self):
         """
-        Add a Polygon to the Canvas
-            
-        Parameters
-        ----------
-        polygon_type: str (default: ```'patches'```)
-            The Polygon's type
+        Private Method that counts the active (i.e., filtered) rows of the loaded dataset per cluster (at the level of the Canvas' current zoom), and renders the clusters within its spatial horizon.
+        """
+        x_range, y_range = self.figure.x_range, self.figure.y_range
 
-        line_width: int (default: 10)
-            The Polygon's border line width
+        if None in [x_range.start, x_range.end, y_range.start, y_range.end]:
+            return
 
-        line_color: str or bokeh.colors instance (default: ```'royalblue'```)
-            The Polygon's border line color
+        x0, x1 = sorted([x_range.start, x_range.end])
+        y0, y1 = sorted([y_range.start, y_range.end])
 
-        fill_color: str or bokeh.colors instance (default: ```'royalblue'```)
-            The Polygon's fill color
+        units_per_pixel = (x1 - x0) / self.__get_canvas_width()
+        level = int(np.clip(np.ceil(np.log2(self.clusters['extent'] / (self.clusters['cell_pixels'] * units_per_pixel))), 0, self.clusters['n_levels'] - 1))
 
-        sec_color: str or bokeh.colors instance (default: ```'lightslategray'```)
-            The Polygon's secondary color (i.e., the polygon's color when disselected).  
+        active = self.clusters['valid']
+        if self.active_index is not None and len(self.active_index) != len(self.data):
+            active = active & self.data.index.isin(self.active_index)
 
-        fill_alpha:float (values in [0,1] -- default: ```0.5```)
-            The Polygon's inner area alpha value
+        x, y, codes, state = self.clusters['x'], self.clusters['y'], self.clusters['levels'][level], self.clusters['state']
+        n_clusters = codes.max() + 1 if len(codes) != 0 else 0
 
-        muted_alpha:float (values in [0,1] -- default: ```0```)
-            The Polygon's overall alpha when disabled from the legend
+        if state is None or state['level'] != level:
+            state = {
+                'level': level, 'active': active, 'count': np.bincount(codes[active], minlength=n_clusters), 
+                'x': np.bincount(codes[active], weights=x[active], minlength=n_clusters), 'y': np.bincount(codes[active], weights=y[active], minlength=n_clusters)
+            }
+        else:
+            # Count only the rows that entered/left the active rows
+            for rows, sign in [(active & ~state['active'], 1), (state['active'] & ~active, -1)]:
+                if rows.any():
+                    state['count'] = state['count'] + sign * np.bincount(codes[rows], minlength=n_clusters)
+                    state['x'] = state['x'] + sign * np.bincount(codes[rows], weights=x[rows], minlength=n_clusters)
+                    state['y'] = state['y'] + sign * np.bincount(codes[rows], weights=y[rows], minlength=n_clusters)
 
-        **kwargs: Dict
-            Other arguments related to the creation of a polygon
-        
-        Returns
-        -------
-        renderer: Bokeh polygon instance
-            The instance of the added polygon
-        """
-        if polygon_type not in ALLOWED_BASIC_POLYGON_TYPES:
-            raise ValueError(f'polygon_type must be one of the following: {ALLOWED_BASIC_POLYGON_TYPES}')
+            state['active'] = active
 
-        coordinates = [f'{col}{self.__suffix}' for col in self.sp_columns]
+        self.clusters['state'] = state
+
+        count = state['count']
+        nonempty = count > 0
+        cx, cy = state['x'][nonempty] / count[nonempty], state['y'][nonempty] / count[nonempty]
+        count = count[nonempty]
+
+        visible = (cx >= x0) & (cx <= x1) & (cy >= y0) & (cy <= y1)
+        cx, cy, count = cx[visible], cy[visible], count[visible]
+
+        scale = np.log(count) / np.log(max(count.max(), 2)) if len(count) != 0 else count
+        sizes = self.clusters['min_size'] + (self.clusters['max_size'] - self.clusters['min_size']) * scale
+        labels = [f'{c / 1000:.1f}k' if c >= 1000 else str(c) for c in count.tolist()]
+
+        self.clusters['source'].data = {'x': cx, 'y': cy, 'count': count, 'size': sizes, 'label': labels}
 
-        renderer = getattr(self.figure, polygon_type)(*coordinates, line_width=line_width, line_color=line_color, fill_color=fill_color, nonselection_fill_color=sec_color, fill_alpha=fill_alpha, muted_alpha=muted_alpha, source=self.source, **kwargs)
-        self.renderers.append(renderer)
 
-        return renderer
-        
-    
     def add_map_tile(self, provider, retina=True, level='underlay', **kwargs):
         """
         Add a Map Tile to the Canvas
@@ -496,7 +1972,7 @@ class st_visualizer:
         self.figure.add_tile(tile_provider, level=level, **kwargs)
 
     
-    def add_hover_tooltips(self, tooltips, **kwargs):
+    def add_hover_tooltips(self, tooltips, lazy=False, cache_size=256, **kwargs):
         """
         Add a Hover Tool to the Canvas.
             
@@ -504,13 +1980,103 @@ class st_visualizer:
         ----------
         tooltips: List
             A list of tuples containing the label and the respective column name prefixed by ```@``` (e.g. [..., ('o_id', '@o_id_column'), ....])
+        lazy: boolean (default: False)
+            Fetch the tooltips' fields of the hovered record from the loaded dataset on demand (Bokeh Server only), instead of passing them to the CDS.
+            The instance's ```prune_columns``` is set, i.e., the CDS keeps only the columns that are referenced by the Canvas (along with the extracted spatial coordinates).
+        cache_size: int (default: 256)
+            The number of fetched records that are cached at the server and at the browser (lazy tooltips only)
         **kwargs: Dict
             Other parameters related to the Hover Tool creation
         """
+        # The fields (i.e., ```@column``` or ```@{column}```) of the tooltips
+        templates = [tooltips] if isinstance(tooltips, str) else [value for _, value in tooltips]
+        fields = [braced or plain for template in templates for braced, plain in re.findall(r'@\{([^}]+)\}|@(\w+)', template)]
+
+        if lazy:
+            self.__add_lazy_hover_tooltips(tooltips, [col for col in dict.fromkeys(fields) if col in self.data.columns], cache_size, **kwargs)
+            return
+
+        self.require_columns(fields)
+
         # Add the HoverTool to the figure
         self.figure.add_tools(HoverTool(tooltips=tooltips, **kwargs))
 
 
+    def __add_lazy_hover_tooltips(self, tooltips, fields, cache_size, **kwargs):
+        """
+        Private Method that adds Hover Tooltips whose fields are fetched on demand. The hovered row (of the CDS) is sent to the server, which fetches the record from the loaded dataset 
+        into a single-row CDS; the record is displayed (at the cursor's position) by the tooltips of an invisible glyph.
+        """
+        if self.figure is None or self.source is None:
+            raise ValueError('You must create a Canvas first.')
+
+        @lru_cache(maxsize=cache_size)
+        def fetch(label):
+            return self.get_source_data(self.data.loc[[label], fields])
+
+        request = ColumnDataSource(data={'position': [-1], 'x': [np.nan], 'y': [np.nan]})
+        record = ColumnDataSource(data={'position': [], '__hover_x': [], '__hover_y': [], **{col: [] for col in fields}})
+
+        def callback(attr, old, new):
+            position = new['position'][0]
+
+            if position < 0 or position >= len(self.source_index) or self.source_index[position] not in self.data.index:
+                return
+
+            record.data = {'position': [position], '__hover_x': new['x'], '__hover_y': new['y'], **fetch(self.source_index[position])}
+
+        request.on_change('data', callback)
+        self.lazy_hover = {'fetch': fetch, 'request': request, 'source': record}
+
+        # The tooltips' fields are fetched on demand; drop the (loaded dataset's) columns of the CDS that are not referenced by the Canvas
+        self.prune_columns = True
+
+        for column_name in [col for col in self.source.data if col in self.data.columns and col not in self.referenced_columns]:
+            self.source.remove(column_name)
+
+        # The record is displayed by the tooltips of an invisible glyph, at the cursor's position
+        renderer = self.figure.circle('__hover_x', '__hover_y', size=20, alpha=0, source=record)
+        self.figure.add_tools(HoverTool(tooltips=tooltips, renderers=[renderer], **kwargs))
+
+        # Records are cached (LRU) at the browser, until the CDS is updated
+        cache_code = '''
+            if (request.cache === undefined) { request.cache = new Map(); }
+        '''
+        hover_callback = CustomJS(args={'request': request, 'record': record}, code=cache_code + '''
+            const indices = cb_data.index.indices;
+            if (indices.length == 0) { return; }
+
+            const position = indices[0], x = cb_data.geometry.x, y = cb_data.geometry.y;
+            const cached = request.cache.get(position);
+
+            if (cached !== undefined) {
+                record.data = Object.assign({}, cached, {'__hover_x': [x], '__hover_y': [y]});
+            } else if (request.data['position'][0] != position) {
+                request.data = {'position': [position], 'x': [x], 'y': [y]};
+            }
+        ''')
+        store_callback = CustomJS(args={'request': request, 'record': record, 'cache_size': cache_size}, code=cache_code + '''
+            if (record.data['position'].length == 0) { return; }
+
+            const position = record.data['position'][0];
+            request.cache.delete(position);
+            request.cache.set(position, record.data);
+
+            if (request.cache.size > cache_size) { request.cache.delete(request.cache.keys().next().value); }
+        ''')
+        clear_callback = CustomJS(args={'request': request}, code=cache_code + '''
+            request.cache.clear();
+            request.data = {'position': [-1], 'x': [NaN], 'y': [NaN]};
+        ''')
+
+        record.js_on_change('data', store_callback)
+        for attr in ['data', 'streaming', 'patching']:
+            self.source.js_on_change(attr, clear_callback)
+
+        renderers = [renderer for renderer in self.renderers if renderer.data_source is self.source]
+        self.figure.add_tools(HoverTool(tooltips=None, renderers=renderers, callback=hover_callback))
+
+
     def add_lasso_select(self, **kwargs):
         """
         Add a Lasso Select Widget to the Canvas
@@ -523,6 +2089,86 @@ class st_visualizer:
         self.figure.add_tools(bokeh_mdl.LassoSelectTool(**kwargs))
 
 
+    def get_temporal_index(self, temporal_name, temporal_unit='s'):
+        """
+        Get the (cached) sorted temporal index of a column of the loaded dataset. The index is built on first use and can be shared by any (custom) filter callback.
+
+        Parameters
+        ----------
+        temporal_name: str
+            The column name of the loaded dataset that contains the temporal information
+        temporal_unit: str (default: ```'s'```)
+            The unit (e.g., seconds -- s) of the temporal information
+
+        Returns
+        -------
+        filter_index.SortedIndex
+            The index of the column's timestamps (as int64 milliseconds)
+        """
+        key = ('temporal', temporal_name, temporal_unit)
+
+        if key not in self.filter_indexes:
+            self.filter_indexes[key] = filter_index.SortedIndex.from_temporal(self.data[temporal_name], unit=temporal_unit)
+
+        return self.filter_indexes[key]
+
+
+    def get_categorical_index(self, categorical_name):
+        """
+        Get the (cached) inverted index of a column of the loaded dataset. The index is built on first use and can be shared by any (custom) filter callback.
+
+        Parameters
+        ----------
+        categorical_name: str
+            The column name of the loaded dataset that contains the categorical information
+
+        Returns
+        -------
+        filter_index.InvertedIndex
+            The index that maps each category of the column to its row positions
+        """
+        key = ('categorical', categorical_name)
+
+        if key not in self.filter_indexes:
+            self.filter_indexes[key] = filter_index.InvertedIndex(self.data[categorical_name])
+
+        return self.filter_indexes[key]
+
+
+    def __add_filter_widget(self, widget, callback_policy, callback_class, spec):
+        """
+        Private Method that connects a filter widget to (an instance of) its callback class and registers it to the instance's filter engine.
+        """
+        callback = callback_class(self, widget)
+
+        widget.on_change(callback_policy, callback.callback)
+        self.widgets.append(widget)
+        self.filter_columns[widget.id] = spec
+        self.filter_engine.register(widget, callback)
+        self.require_columns([spec['column']])
+
+
+    def get_numerical_index(self, numeric_name):
+        """
+        Get the (cached) sorted index of a numerical column of the loaded dataset. The index is built once and reused by every numerical filter on the column.
+
+        Parameters
+        ----------
+        numeric_name: str
+            The column name of the loaded dataset that contains the numerical values
+
+        Returns
+        -------
+        filter_index.SortedIndex
+        """
+        key = ('numerical', numeric_name)
+
+        if key not in self.filter_indexes:
+            self.filter_indexes[key] = filter_index.SortedIndex(self.data[numeric_name])
+
+        return self.filter_indexes[key]
+
+
     def add_temporal_filter(self, temporal_name='ts', temporal_unit='s', step_ms=3600000, title='Temporal Horizon', height_policy='min', callback_policy='value_throttled', callback_class=None, **kwargs):
         """
         Add a Temporal Filter to the Canvas
@@ -558,32 +2204,35 @@ class st_visualizer:
         temp_filter = bokeh_mdl.DateRangeSlider(start=start_date, end=end_date, value=(start_date, end_date), step=step, title=title, height_policy=height_policy, **kwargs)
         temp_filter.format = '%d %b %Y %H:%M:%S.%3N'
 
+        if self.client_filtering is not None and callback_class is None:
+            return self.__add_client_filter(temp_filter, callback_policy, {'type': 'temporal', 'column': temporal_name, 'unit': temporal_unit})
+
+        # Convert (once) the timestamps to int64 milliseconds and sort them, so that each window is answered with binary search
+        self.get_temporal_index(temporal_name, temporal_unit)
 
         if callback_class is None:
             class Callback(callbacks.BokehFilters):
                 def __init__(self, vsn_instance, widget):
                     super().__init__(vsn_instance, widget)
                 
-                def callback(self, attr, old, new):
-                    self.callback_filter_data()
-
+                def compute_mask(self):
                     new_horizon = self.widget.value
                     new_start = pd.to_datetime(new_horizon[0], unit='ms')
                     new_end   = pd.to_datetime(new_horizon[1], unit='ms')
 
                     # self.widget.title = (f'{title}: {new_start}...{new_end}')
 
-                    new_pts = self.get_data()
-                    new_pts = new_pts.loc[pd.to_datetime(new_pts[temporal_name], unit=temporal_unit).between(new_start, new_end)]
+                    temporal_index = self.vsn_instance.get_temporal_index(temporal_name, temporal_unit)
+                    return temporal_index.range_mask(new_start.value // 10**6, new_end.value // 10**6)
 
-                    self.callback_prepare_data(new_pts, self.widget.id==self.vsn_instance.aquire_canvas_data)
+                def callback(self, attr, old, new):
+                    self.callback_update_mask()
             callback_class = Callback
         
-        temp_filter.on_change(callback_policy, callback_class(self, temp_filter).callback)
-        self.widgets.append(temp_filter)
+        self.__add_filter_widget(temp_filter, callback_policy, callback_class, {'type': 'temporal', 'column': temporal_name, 'unit': temporal_unit})
 
     
-    def add_categorical_filter(self, title='Category', categorical_name='City_Country', height_policy='min', callback_class=None, **kwargs):
+    def add_categorical_filter(self, title='Category', categorical_name='City_Country', height_policy='min', multiselect=False, callback_class=None, **kwargs):
         """
         Add a Categorical Filter to the Canvas
         
@@ -596,6 +2245,8 @@ class st_visualizer:
         height_policy: str (default: 'min')
             Describes how the component should maintain its height (accepted values: 'auto', 'fixed', 'fit', 'min', 'max')
             From: https://docs.bokeh.org/en/1.1.0/docs/reference/models/layouts.html#bokeh.models.layouts.LayoutDOM.height_policy
+        multiselect: boolean (default: False)
+            Allow multiple categories to be selected at once (via a MultiSelect widget)
         callback_class: callbacks.BokehFilters (default: None)
             Allows custom callback methods to be set. If None, the baseline callback method is used.
         **kwargs: Dict
@@ -604,32 +2255,41 @@ class st_visualizer:
         kwargs.pop('value', None)
         kwargs.pop('options', None)
 
-        options = [('', 'Select...')]
-        options.extend([(i, i) for i in sorted(self.data[categorical_name].unique())])
+        # Map (once) each category to its row positions
+        categorical_index = self.get_categorical_index(categorical_name)
+
+        options = [] if multiselect else [('', 'Select...')]
+        options.extend([(i, i) for i in sorted(categorical_index.categories)])
 
-        cat_filter = bokeh_mdl.Select(title=title, options=options, value=options[0][0], height_policy=height_policy, **kwargs)
+        if multiselect:
+            cat_filter = bokeh_mdl.MultiSelect(title=title, options=options, value=[], height_policy=height_policy, **kwargs)
+        else:
+            cat_filter = bokeh_mdl.Select(title=title, options=options, value=options[0][0], height_policy=height_policy, **kwargs)
+
+        if self.client_filtering is not None and callback_class is None:
+            return self.__add_client_filter(cat_filter, 'value', {'type': 'categorical', 'column': categorical_name, 'multiselect': multiselect})
 
         if callback_class is None:
             class Callback(callbacks.BokehFilters):
                 def __init__(self, vsn_instance, widget):
                     super().__init__(vsn_instance, widget)
                 
-                def callback(self, attr, old, new):
-                    self.callback_filter_data()
-
+                def compute_mask(self):
                     cat_value = self.widget.value
-                    new_pts = self.get_data()
 
                     # print (cat_value, categorical_name)
-                    if cat_value:
-                        new_pts = new_pts.loc[new_pts[categorical_name] == cat_value].copy()
-                    
-                    self.callback_prepare_data(new_pts, self.widget.id==self.vsn_instance.aquire_canvas_data)
+                    if not cat_value:
+                        return None
+
+                    categorical_index = self.vsn_instance.get_categorical_index(categorical_name)
+                    return categorical_index.mask(cat_value)
+
+                def callback(self, attr, old, new):
+                    self.callback_update_mask()
             
             callback_class = Callback
 
-        cat_filter.on_change('value', callback_class(self, cat_filter).callback)
-        self.widgets.append(cat_filter)
+        self.__add_filter_widget(cat_filter, 'value', callback_class, {'type': 'categorical', 'column': categorical_name, 'multiselect': multiselect})
     
 
     def add_numerical_filter(self, filter_mode='>=', title='Value', numeric_name='Altitude', step=50, height_policy='min', callback_policy='value_throttled', callback_class=None, **kwargs):
@@ -674,28 +2334,29 @@ class st_visualizer:
             value = (start, end)
             num_filter = bokeh_mdl.RangeSlider(start=start, end=end, step=step, value=value, title=title, height_policy=height_policy, **kwargs)
 
+        if self.client_filtering is not None and callback_class is None:
+            return self.__add_client_filter(num_filter, callback_policy, {'type': 'numerical', 'column': numeric_name, 'operator': filter_mode})
+
+        # Sort (once) the numerical values, so that each threshold/range query is answered with binary search (and each equality query with a hash lookup)
+        self.get_numerical_index(numeric_name)
+
         if callback_class is None:
             class Callback(callbacks.BokehFilters):
                 def __init__(self, vsn_instance, widget):
                     super().__init__(vsn_instance, widget)
                 
-                def callback(self, attr, old, new):
-                    self.callback_filter_data()
+                def compute_mask(self):
+                    num_value = self.widget.value
+                    numerical_index = self.vsn_instance.get_numerical_index(numeric_name)
 
-                    num_value = new
-                    new_pts = self.get_data()
+                    return numerical_index.query_mask(filter_mode, tuple(num_value) if filter_mode == 'range' else num_value)
 
-                    if filter_mode == 'range':
-                        new_pts = new_pts.loc[new_pts[numeric_name].between(num_value[0], num_value[1], inclusive=True)]
-                    else:
-                        new_pts = new_pts.loc[ALLOWED_FILTER_OPERATORS[filter_mode](new_pts[numeric_name], num_value)]
-            
-                    self.callback_prepare_data(new_pts, self.widget.id==self.vsn_instance.aquire_canvas_data)
+                def callback(self, attr, old, new):
+                    self.callback_update_mask()
             
             callback_class = Callback
 
-        num_filter.on_change(callback_policy, callback_class(self, num_filter).callback)
-        self.widgets.append(num_filter)
+        self.__add_filter_widget(num_filter, callback_policy, callback_class, {'type': 'numerical', 'column': numeric_name})
     
 
     def show_figures(self, figures=None, sizing_mode=None, toolbar_location='above', ncols=None, plot_width=None, plot_height=None, toolbar_options=None, merge_tools=True, notebook=True, doc=None, notebook_url='http://localhost:8888', **kwargs):
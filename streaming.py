@@ -0,0 +1,45 @@
+'''
+	streaming.py - v2020.05.12
+
+	Authors: Andreas Tritsarolis, Christos Doulkeridis, Yannis Theodoridis and Nikos Pelekis
+'''
+
+
+import time
+import pandas as pd
+
+
+def replay_csv(filepath, batch_size=500, rate=None, loop=False, **kwargs):
+	"""
+	Replay a CSV file as a (live) feed of records, i.e., a generator of record batches. Intended for testing ```st_visualizer.stream_data```.
+
+	Parameters
+	----------
+	filepath: str
+		The path to the CSV source file
+	batch_size: int (default: 500)
+		The number of records of each batch
+	rate: float (default: None)
+		The number of records per second that the feed will (approximately) produce. If None, the batches are produced as soon as they are requested
+		(e.g., when the pace is set by a ```bokeh.document.Document.add_periodic_callback```).
+	loop: boolean (default: False)
+		Restart the feed from the beginning of the file when it is exhausted
+	**kwargs: Dict
+		Other arguments related to parsing a CSV file (consult pandas.read_csv method)
+
+	Returns
+	-------
+	Generator of Pandas DataFrames
+	"""
+	while True:
+		next_batch = time.monotonic()
+
+		for batch in pd.read_csv(filepath, chunksize=batch_size, **kwargs):
+			if rate is not None:
+				time.sleep(max(next_batch - time.monotonic(), 0))
+				next_batch += len(batch) / rate
+
+			yield batch
+
+		if not loop:
+			break